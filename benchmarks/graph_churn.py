@@ -0,0 +1,124 @@
+"""
+Measures DirectedGraph throughput under a churn workload that mixes node and edge insertions and removals.
+
+"Before" rebuilds the original list-based adjacency layout, where removing a node scans every
+adjacency list and removing an edge calls list.remove. "After" measures DirectedGraph,
+which keeps a reverse adjacency index and set-like neighbor storage.
+
+Run from the repository root:
+    python -m benchmarks.graph_churn [node count] [edges per node] [operation count]
+"""
+import random
+import sys
+import time
+from typing import Dict, List
+
+from graphs.directed_graph import DirectedGraph
+
+
+class _ListGraph:
+    def __init__(self):
+        self.__adjacency_list: Dict[str, List[str]] = {}
+
+    def add_node(self, label: str):
+        if label not in self.__adjacency_list:
+            self.__adjacency_list[label] = []
+
+    def add_edge(self, first: str, second: str):
+        self.__adjacency_list[first].append(second)
+
+    def remove_node(self, label: str):
+        if label not in self.__adjacency_list:
+            return
+        for connections in self.__adjacency_list.values():
+            if label in connections:
+                connections.remove(label)
+        self.__adjacency_list.pop(label)
+
+    def remove_edge(self, first: str, second: str):
+        connections = self.__adjacency_list.get(first)
+        if connections is not None and second in connections:
+            connections.remove(second)
+
+
+def create_operations(node_count: int, edges_per_node: int, operation_count: int) -> (List[tuple], List[tuple]):
+    """
+    Creates an initial graph and a stream of operations, so every layout replays the same workload.
+    :return: the initial edges and the operations.
+    """
+    random.seed(0)
+
+    live: List[str] = [f'n{i}' for i in range(node_count)]
+    initial_edges = [(random.choice(live), random.choice(live)) for _ in range(node_count * edges_per_node)]
+    edges: List[tuple] = list(initial_edges)
+    operations: List[tuple] = []
+    next_label = node_count
+
+    for _ in range(operation_count):
+        kind = random.random()
+
+        if kind < 0.25:
+            # Add a node and connect it to a few existing nodes
+            label = f'n{next_label}'
+            next_label += 1
+            operations.append(('add_node', label))
+            for _ in range(edges_per_node):
+                edge = (label, random.choice(live))
+                operations.append(('add_edge',) + edge)
+                edges.append(edge)
+            live.append(label)
+        elif kind < 0.5:
+            # Remove a random node, by swapping it with the last one
+            index = random.randrange(len(live))
+            live[index], live[-1] = live[-1], live[index]
+            operations.append(('remove_node', live.pop()))
+        elif kind < 0.75:
+            edge = (random.choice(live), random.choice(live))
+            operations.append(('add_edge',) + edge)
+            edges.append(edge)
+        else:
+            operations.append(('remove_edge',) + random.choice(edges))
+
+    return initial_edges, operations
+
+
+def run(graph, node_count: int, initial_edges: List[tuple], operations: List[tuple]) -> float:
+    """
+    Builds the initial graph and replays the operations against it.
+    :return: the time spent replaying the operations, in seconds.
+    """
+    for i in range(node_count):
+        graph.add_node(f'n{i}')
+    for first, second in initial_edges:
+        graph.add_edge(first, second)
+
+    start = time.perf_counter()
+
+    for operation in operations:
+        name = operation[0]
+        if name == 'add_node':
+            graph.add_node(operation[1])
+        elif name == 'remove_node':
+            graph.remove_node(operation[1])
+        elif name == 'add_edge':
+            graph.add_edge(operation[1], operation[2])
+        else:
+            graph.remove_edge(operation[1], operation[2])
+
+    return time.perf_counter() - start
+
+
+def main(node_count: int, edges_per_node: int, operation_count: int):
+    initial_edges, operations = create_operations(node_count, edges_per_node, operation_count)
+
+    print(f'{node_count} nodes, {len(initial_edges)} edges, {len(operations)} operations')
+
+    for name, graph in [('before (list scan)', _ListGraph()), ('after (reverse index)', DirectedGraph())]:
+        seconds = run(graph, node_count, initial_edges, operations)
+        print(f'{name:<25}{seconds:>10.3f} s{len(operations) / seconds:>14.0f} ops/s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 20_000)
@@ -0,0 +1,61 @@
+"""
+Compares the ways of building a WeightedGraph from an edge list: one add_node/add_edge call per item,
+from_edge_list, loading a snapshot into a mutable graph, and memory-mapping a snapshot as a FrozenGraph.
+
+Run from the repository root:
+    python -m benchmarks.graph_loading [node count] [edge count]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from graphs.frozen_graph import FrozenGraph
+from graphs.weighted_graph import WeightedGraph
+
+
+def add_one_by_one(edges) -> WeightedGraph:
+    graph = WeightedGraph()
+    for first, second, weight in edges:
+        graph.add_node(first)
+        graph.add_node(second)
+        graph.add_edge(first, second, weight)
+    return graph
+
+
+def main(node_count: int, edge_count: int):
+    random.seed(0)
+    labels = [f'n{i}' for i in range(node_count)]
+    edges = [(random.choice(labels), random.choice(labels), random.randint(1, 100)) for _ in range(edge_count)]
+
+    path = os.path.join(tempfile.mkdtemp(), 'graph.snapshot')
+
+    print(f'{node_count} nodes, {edge_count} edges')
+
+    start = time.perf_counter()
+    add_one_by_one(edges)
+    print(f'{"add_node/add_edge":<30}{time.perf_counter() - start:>10.3f} s')
+
+    start = time.perf_counter()
+    graph = WeightedGraph.from_edge_list(edges)
+    print(f'{"from_edge_list":<30}{time.perf_counter() - start:>10.3f} s')
+
+    start = time.perf_counter()
+    graph.save(path)
+    print(f'{"save":<30}{time.perf_counter() - start:>10.3f} s{os.path.getsize(path) / edge_count:>10.1f} bytes/edge')
+
+    start = time.perf_counter()
+    WeightedGraph.load(path)
+    print(f'{"WeightedGraph.load":<30}{time.perf_counter() - start:>10.3f} s')
+
+    start = time.perf_counter()
+    FrozenGraph.load(path)
+    print(f'{"FrozenGraph.load (mmap)":<30}{time.perf_counter() - start:>10.3f} s')
+
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
@@ -0,0 +1,132 @@
+"""
+Measures the memory cost of a node and of an edge in the graph implementations.
+
+"Before" rebuilds the original storage layout: _Node and _Edge objects with a per-instance __dict__,
+held in dictionaries declared on the class. "After" measures the slotted, per-instance
+DirectedGraph and WeightedGraph, and their frozen CSR snapshots.
+
+Run from the repository root:
+    python -m benchmarks.graph_memory [node count] [edges per node]
+"""
+import random
+import sys
+import tracemalloc
+from typing import Callable, Dict, List
+
+from graphs.directed_graph import DirectedGraph
+from graphs.weighted_graph import WeightedGraph
+
+
+class _DictNode:
+    def __init__(self, label: str):
+        self.__label = label
+
+
+class _DictEdge:
+    def __init__(self, source: _DictNode, target: _DictNode, weight: int):
+        self.__source = source
+        self.__target = target
+        self._weight = weight
+
+
+def build_dict_directed(labels: List[str], edges: List[tuple]):
+    nodes: Dict[str, _DictNode] = {}
+    adjacency_list: Dict[_DictNode, List[_DictNode]] = {}
+
+    for label in labels:
+        node = _DictNode(label)
+        nodes[label] = node
+        adjacency_list[node] = []
+
+    for first, second, _ in edges:
+        adjacency_list[nodes[first]].append(nodes[second])
+
+    return nodes, adjacency_list
+
+
+def build_dict_weighted(labels: List[str], edges: List[tuple]):
+    nodes: Dict[str, _DictNode] = {}
+    adjacency_list: Dict[_DictNode, List[_DictEdge]] = {}
+
+    for label in labels:
+        node = _DictNode(label)
+        nodes[label] = node
+        adjacency_list[node] = []
+
+    for first, second, weight in edges:
+        first_node = nodes[first]
+        second_node = nodes[second]
+        adjacency_list[first_node].append(_DictEdge(first_node, second_node, weight))
+        adjacency_list[second_node].append(_DictEdge(second_node, first_node, weight))
+
+    return nodes, adjacency_list
+
+
+def build_directed(labels: List[str], edges: List[tuple]) -> DirectedGraph:
+    graph = DirectedGraph()
+    for label in labels:
+        graph.add_node(label)
+    for first, second, _ in edges:
+        graph.add_edge(first, second)
+    return graph
+
+
+def build_weighted(labels: List[str], edges: List[tuple]) -> WeightedGraph:
+    graph = WeightedGraph()
+    for label in labels:
+        graph.add_node(label)
+    for first, second, weight in edges:
+        graph.add_edge(first, second, weight)
+    return graph
+
+
+def measure(build: Callable[[], object]) -> int:
+    """
+    Measures the bytes allocated by a build function that are still alive once it returns.
+    :param build: is the function building the structure.
+    :return: the amount of bytes held by the built structure.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Keep the result alive until the measurement is taken
+    del result
+    return after - before
+
+
+def main(node_count: int, edges_per_node: int):
+    random.seed(0)
+
+    # Create labels up front, so their own cost is excluded from every measurement
+    labels = [f'n{i}' for i in range(node_count)]
+    edges = [(random.choice(labels), random.choice(labels), random.randint(1, 100))
+             for _ in range(node_count * edges_per_node)]
+
+    layouts = [
+        ('directed, before (__dict__, class-level)', build_dict_directed),
+        ('directed, after (__slots__, per-instance)', build_directed),
+        ('directed, frozen (CSR)', lambda l, e: build_directed(l, e).freeze()),
+        ('weighted, before (__dict__, class-level)', build_dict_weighted),
+        ('weighted, after (__slots__, per-instance)', build_weighted),
+        ('weighted, frozen (CSR)', lambda l, e: build_weighted(l, e).freeze()),
+    ]
+
+    print(f'{node_count} nodes, {len(edges)} edges')
+    print(f'{"layout":<45}{"bytes/node":>12}{"bytes/edge":>12}')
+
+    for name, build in layouts:
+        nodes_only = measure(lambda: build(labels, []))
+        with_edges = measure(lambda: build(labels, edges))
+
+        bytes_per_node = nodes_only / node_count
+        bytes_per_edge = (with_edges - nodes_only) / len(edges)
+
+        print(f'{name:<45}{bytes_per_node:>12.1f}{bytes_per_edge:>12.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 5)
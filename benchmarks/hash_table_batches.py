@@ -0,0 +1,81 @@
+"""
+Measures put_many, get_many and remove_many of the chained HashTable against calling put, get and remove once per key.
+
+Both tables start with 8 buckets. Looping over put grows the table once per doubling and rehashes incrementally,
+while put_many grows it once, to fit the whole batch. The keys are given to the batch operations in batches
+of the given size.
+
+Run from the repository root:
+    python -m benchmarks.hash_table_batches [key count] [batch size]
+"""
+import random
+import sys
+import time
+from typing import List
+
+from hash_tables.hash_table import HashTable
+
+
+def per_call(keys: List[int]) -> List[float]:
+    table = HashTable(8)
+    timings = []
+
+    start = time.perf_counter()
+    for key in keys:
+        table.put(key, 'value')
+    timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in keys:
+        table.get(key)
+    timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in keys:
+        table.remove(key)
+    timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def batched(keys: List[int], batch_size: int) -> List[float]:
+    table = HashTable(8)
+    batches = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+    timings = []
+
+    start = time.perf_counter()
+    for batch in batches:
+        table.put_many(batch, ['value'] * len(batch))
+    timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for batch in batches:
+        table.get_many(batch)
+    timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for batch in batches:
+        table.remove_many(batch)
+    timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def main(key_count: int, batch_size: int):
+    random.seed(0)
+    keys = random.sample(range(key_count * 10), key_count)
+
+    print(f'{key_count} keys, batches of {batch_size}, seconds')
+    print(f'{"method":<24}{"put":>10}{"get":>10}{"remove":>10}')
+
+    baseline = per_call(keys)
+    print(f'{"per call":<24}' + ''.join(f'{seconds:>10.2f}' for seconds in baseline))
+
+    timings = batched(keys, batch_size)
+    print(f'{"batched":<24}' + ''.join(f'{seconds:>10.2f}' for seconds in timings))
+    print(f'{"speedup":<24}' + ''.join(f'{before / after:>10.2f}' for before, after in zip(baseline, timings)))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 10_000)
@@ -0,0 +1,62 @@
+"""
+Measures the latency of each put while a hash table grows under a steady stream of inserts,
+for the chained HashTable rehashing incrementally and all at once, and for the OpenAddressingHashTable.
+
+A table that rehashes all at once is fast on average, but every time it doubles, one put has to move every
+key-value pair, which shows in the tail latencies. Incremental rehashing spreads that work over the puts that follow.
+
+Run from the repository root:
+    python -m benchmarks.hash_table_latency [key count]
+"""
+import gc
+import random
+import sys
+import time
+from typing import List
+
+from hash_tables.hash_table import HashTable
+from hash_tables.open_addressing_hash_table import OpenAddressingHashTable
+
+
+def percentile(sorted_latencies: List[int], fraction: float) -> int:
+    return sorted_latencies[min(len(sorted_latencies) - 1, int(len(sorted_latencies) * fraction))]
+
+
+def main(key_count: int):
+    random.seed(0)
+    keys = random.sample(range(key_count * 10), key_count)
+
+    tables = [
+        ('chained, incremental', HashTable(8)),
+        ('chained, all at once', HashTable(8, rehash_step=None)),
+        ('open addressing', OpenAddressingHashTable()),
+    ]
+
+    print(f'{key_count} puts, latencies in microseconds')
+    print(f'{"table":<24}{"mean":>10}{"p50":>10}{"p99":>10}{"p99.9":>10}{"max":>12}')
+
+    for name, table in tables:
+        latencies: List[int] = []
+        clock = time.perf_counter_ns
+
+        # The pauses of the cyclic garbage collector would otherwise dominate the tail of every table
+        gc.collect()
+        gc.disable()
+
+        for key in keys:
+            start = clock()
+            table.put(key, 'value')
+            latencies.append(clock() - start)
+
+        gc.enable()
+
+        mean = sum(latencies) / len(latencies)
+        latencies.sort()
+
+        print(f'{name:<24}{mean / 1000:>10.2f}{percentile(latencies, 0.5) / 1000:>10.2f}'
+              f'{percentile(latencies, 0.99) / 1000:>10.2f}{percentile(latencies, 0.999) / 1000:>10.2f}'
+              f'{latencies[-1] / 1000:>12.0f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
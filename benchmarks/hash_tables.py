@@ -0,0 +1,54 @@
+"""
+Measures put, get and remove throughput of the chained HashTable against the OpenAddressingHashTable.
+
+The chained table has a fixed amount of buckets, so it is given one per key up front. The keys are a shuffled range,
+so each lands in its own bucket: the best case for chaining. The open addressing table starts small and grows,
+so its put throughput includes every resize.
+
+Run from the repository root:
+    python -m benchmarks.hash_tables [key count]
+"""
+import random
+import sys
+import time
+
+from hash_tables.hash_table import HashTable
+from hash_tables.open_addressing_hash_table import OpenAddressingHashTable
+
+
+def measure(table, keys) -> list:
+    timings = []
+
+    start = time.perf_counter()
+    for key in keys:
+        table.put(key, 'value')
+    timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in keys:
+        table.get(key)
+    timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in keys:
+        table.remove(key)
+    timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def main(key_count: int):
+    random.seed(0)
+    keys = list(range(key_count))
+    random.shuffle(keys)
+
+    print(f'{key_count} keys')
+    print(f'{"table":<24}{"put/s":>12}{"get/s":>12}{"remove/s":>12}')
+
+    for name, table in [('chained', HashTable(key_count)), ('open addressing', OpenAddressingHashTable())]:
+        timings = measure(table, keys)
+        print(f'{name:<24}' + ''.join(f'{key_count / seconds:>12.0f}' for seconds in timings))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,77 @@
+"""
+Compares keeping a build schedule current over a stream of edge insertions in two ways:
+recomputing topological_sort after every add_edge, and maintaining the order incrementally.
+
+The edges follow a hidden random order of the nodes, so the graph stays acyclic,
+while most edges still go against the order maintained so far and force some reordering.
+
+Run from the repository root:
+    python -m benchmarks.incremental_topological_order [node count] [edge count]
+"""
+import random
+import sys
+import time
+from typing import List
+
+from graphs.directed_graph import DirectedGraph
+
+
+def create_edges(node_count: int, edge_count: int) -> List[tuple]:
+    random.seed(0)
+
+    hidden_order = list(range(node_count))
+    random.shuffle(hidden_order)
+
+    edges: List[tuple] = []
+    for _ in range(edge_count):
+        first, second = sorted(random.sample(range(node_count), 2))
+        edges.append((f'n{hidden_order[first]}', f'n{hidden_order[second]}'))
+
+    return edges
+
+
+def build_nodes(node_count: int) -> DirectedGraph:
+    graph = DirectedGraph()
+    for i in range(node_count):
+        graph.add_node(f'n{i}')
+    return graph
+
+
+def recompute(node_count: int, edges: List[tuple]) -> float:
+    graph = build_nodes(node_count)
+
+    start = time.perf_counter()
+    for first, second in edges:
+        graph.add_edge(first, second)
+        graph.topological_sort()
+
+    return time.perf_counter() - start
+
+
+def incremental(node_count: int, edges: List[tuple]) -> float:
+    graph = build_nodes(node_count)
+    graph.maintain_topological_order()
+
+    start = time.perf_counter()
+    for first, second in edges:
+        graph.add_edge(first, second)
+
+    # Reading the order once at the end is enough to keep the schedule available at any time
+    graph.get_topological_order()
+
+    return time.perf_counter() - start
+
+
+def main(node_count: int, edge_count: int):
+    edges = create_edges(node_count, edge_count)
+
+    print(f'{node_count} nodes, {edge_count} edge insertions')
+
+    for name, run in [('full recomputation', recompute), ('incremental (Pearce-Kelly)', incremental)]:
+        seconds = run(node_count, edges)
+        print(f'{name:<30}{seconds:>10.3f} s{seconds / edge_count * 1e6:>12.1f} us/insert')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 6_000)
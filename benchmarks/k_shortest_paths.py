@@ -0,0 +1,54 @@
+"""
+Measures the latency of each additional path yielded by WeightedGraph.get_k_shortest_paths,
+on the same road-like grid as the point-to-point search benchmark.
+
+Each path costs one shortest-path search per node of the previous path, so the latency per path
+should stay roughly flat as more paths are taken, instead of growing with the amount of paths asked for.
+
+Run from the repository root:
+    python -m benchmarks.k_shortest_paths [grid side] [query count] [paths per query]
+"""
+import random
+import sys
+import time
+from typing import List
+
+from benchmarks.point_to_point_search import build_grid
+
+
+def main(side: int, query_count: int, path_count: int):
+    graph = build_grid(side)
+
+    random.seed(1)
+    queries = [
+        (f'{random.randrange(side)},{random.randrange(side)}', f'{random.randrange(side)},{random.randrange(side)}')
+        for _ in range(query_count)
+    ]
+
+    # Holds the total seconds spent on the i-th path of every query
+    totals: List[float] = [0.0] * path_count
+
+    start = time.perf_counter()
+    for source, target in queries:
+        paths = graph.get_k_shortest_paths(source, target)
+
+        for i in range(path_count):
+            path_start = time.perf_counter()
+            if next(paths, None) is None:
+                break
+            totals[i] += time.perf_counter() - path_start
+    seconds = time.perf_counter() - start
+
+    print(f'{side * side} nodes, {query_count} queries, {path_count} paths per query, {seconds:.2f} s in total')
+    print(f'{"path":<8}{"ms/path":>12}{"cumulative ms":>16}')
+
+    cumulative = 0.0
+    for i, total in enumerate(totals):
+        cumulative += total
+        print(f'{i + 1:<8}{total / query_count * 1000:>12.2f}{cumulative / query_count * 1000:>16.2f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 10)
@@ -0,0 +1,55 @@
+"""
+Measures PageRank iterations per second on a large frozen DirectedGraph, in pure Python,
+and vectorized with NumPy when it is installed. Also times the degree centralities.
+
+The tolerance is 0, so every run does the full amount of iterations.
+
+Run from the repository root:
+    python -m benchmarks.pagerank [node count] [edge count] [iterations]
+"""
+import random
+import sys
+import time
+
+from graphs import centrality
+from graphs.centrality import in_degree_centrality, out_degree_centrality, pagerank
+from graphs.directed_graph import DirectedGraph
+
+
+def build_graph(node_count: int, edge_count: int) -> DirectedGraph:
+    random.seed(0)
+
+    # Targets are skewed towards low ids, so some nodes are far more popular than others
+    def edges():
+        for _ in range(edge_count):
+            yield f'n{random.randrange(node_count)}', f'n{int(node_count * random.random() ** 2)}'
+
+    return DirectedGraph.from_edge_list(edges())
+
+
+def main(node_count: int, edge_count: int, iterations: int):
+    frozen = build_graph(node_count, edge_count).freeze()
+    print(f'{frozen.node_count} nodes, {frozen.edge_count} edges, {iterations} iterations')
+    print(f'{"method":<24}{"total s":>10}{"iterations/s":>16}')
+
+    for name, use_numpy in [('pure Python', False), ('NumPy', True)]:
+        if use_numpy and centrality.numpy is None:
+            print(f'{name:<24}{"not installed":>26}')
+            continue
+
+        start = time.perf_counter()
+        _, count = pagerank(frozen, tolerance=0, max_iterations=iterations, use_numpy=use_numpy)
+        seconds = time.perf_counter() - start
+
+        print(f'{name:<24}{seconds:>10.3f}{count / seconds:>16.2f}')
+
+    start = time.perf_counter()
+    in_degree_centrality(frozen)
+    out_degree_centrality(frozen)
+    print(f'{"degree centralities":<24}{time.perf_counter() - start:>10.3f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 20)
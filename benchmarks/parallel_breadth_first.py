@@ -0,0 +1,69 @@
+"""
+Measures how the level-synchronous breadth_first_depths scales with the amount of worker processes,
+against a full traverse_breadth_first on the DirectedGraph and on its FrozenGraph.
+The last run searches a memory-mapped snapshot of the FrozenGraph, as loaded on a cold start.
+
+Run from the repository root:
+    python -m benchmarks.parallel_breadth_first [node count] [edges per node]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from graphs.directed_graph import DirectedGraph
+from graphs.frozen_graph import FrozenGraph
+from graphs.parallel import breadth_first_depths
+
+
+def build_graph(node_count: int, edges_per_node: int) -> DirectedGraph:
+    random.seed(0)
+
+    def edges():
+        for _ in range(node_count * edges_per_node):
+            yield f'n{random.randrange(node_count)}', f'n{random.randrange(node_count)}'
+
+    return DirectedGraph.from_edge_list(edges())
+
+
+def main(node_count: int, edges_per_node: int):
+    graph = build_graph(node_count, edges_per_node)
+    frozen = graph.freeze()
+    start_label = frozen.labels[0]
+
+    print(f'{frozen.node_count} nodes, {frozen.edge_count} edges, {os.cpu_count()} CPUs')
+    print(f'{"method":<32}{"seconds":>10}{"speedup":>10}')
+
+    start = time.perf_counter()
+    for _ in graph.traverse_breadth_first(start_label):
+        pass
+    baseline = time.perf_counter() - start
+    print(f'{"DirectedGraph traversal":<32}{baseline:>10.2f}{1:>10.2f}')
+
+    start = time.perf_counter()
+    for _ in frozen.traverse_breadth_first(start_label):
+        pass
+    seconds = time.perf_counter() - start
+    print(f'{"FrozenGraph traversal":<32}{seconds:>10.2f}{baseline / seconds:>10.2f}')
+
+    for workers in [1, 2, 4, 8]:
+        start = time.perf_counter()
+        breadth_first_depths(frozen, start_label, workers)
+        seconds = time.perf_counter() - start
+        print(f'{f"breadth_first_depths, {workers} workers":<32}{seconds:>10.2f}{baseline / seconds:>10.2f}')
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'graph.snapshot')
+        frozen.save(path)
+        loaded = FrozenGraph.load(path, memory_map=True)
+
+        start = time.perf_counter()
+        breadth_first_depths(loaded, start_label, 8)
+        seconds = time.perf_counter() - start
+        print(f'{"loaded snapshot, 8 workers":<32}{seconds:>10.2f}{baseline / seconds:>10.2f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 5)
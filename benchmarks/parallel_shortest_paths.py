@@ -0,0 +1,53 @@
+"""
+Measures how all_pairs_shortest_paths scales with the amount of worker processes,
+against calling get_shortest_distances in a loop on a single core.
+
+Run from the repository root:
+    python -m benchmarks.parallel_shortest_paths [node count] [edges per node] [source count]
+"""
+import os
+import random
+import sys
+import time
+
+from graphs.weighted_graph import WeightedGraph
+
+
+def build_graph(node_count: int, edges_per_node: int) -> WeightedGraph:
+    random.seed(0)
+
+    graph = WeightedGraph()
+    for i in range(node_count):
+        graph.add_node(f'n{i}')
+    for _ in range(node_count * edges_per_node):
+        graph.add_edge(f'n{random.randrange(node_count)}', f'n{random.randrange(node_count)}', random.randint(1, 100))
+
+    return graph
+
+
+def main(node_count: int, edges_per_node: int, source_count: int):
+    graph = build_graph(node_count, edges_per_node)
+    sources = [f'n{i}' for i in range(source_count)]
+
+    print(f'{node_count} nodes, {node_count * edges_per_node} edges, {source_count} sources, '
+          f'{os.cpu_count()} CPUs')
+    print(f'{"workers":<12}{"seconds":>10}{"sources/s":>12}{"speedup":>10}')
+
+    start = time.perf_counter()
+    for source in sources:
+        graph.get_shortest_distances(source)
+    baseline = time.perf_counter() - start
+    print(f'{"loop":<12}{baseline:>10.2f}{source_count / baseline:>12.1f}{1:>10.2f}')
+
+    for workers in [1, 2, 4, 8]:
+        start = time.perf_counter()
+        for _ in graph.all_pairs_shortest_paths(sources, workers):
+            pass
+        seconds = time.perf_counter() - start
+        print(f'{workers:<12}{seconds:>10.2f}{source_count / seconds:>12.1f}{baseline / seconds:>10.2f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 64)
@@ -0,0 +1,78 @@
+"""
+Compares point-to-point shortest-path searches on a road-like WeightedGraph:
+plain Dijkstra, bidirectional Dijkstra and A* with the straight-line distance heuristic.
+
+The graph is a grid with jittered node positions. Each node connects to its right and lower neighbors,
+plus the odd diagonal, with a weight of the straight-line distance times a random detour factor of at least 1,
+so the straight-line distance never overestimates.
+
+Run from the repository root:
+    python -m benchmarks.point_to_point_search [grid side] [query count]
+"""
+import math
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from graphs.weighted_graph import WeightedGraph
+
+
+def build_grid(side: int) -> WeightedGraph:
+    random.seed(0)
+
+    graph = WeightedGraph()
+    positions: Dict[str, Tuple[float, float]] = {}
+
+    for row in range(side):
+        for column in range(side):
+            label = f'{row},{column}'
+            positions[label] = (column + random.uniform(-0.3, 0.3), row + random.uniform(-0.3, 0.3))
+            graph.add_node(label, positions[label])
+
+    def connect(first: str, second: str):
+        weight = math.dist(positions[first], positions[second]) * random.uniform(1.0, 1.5)
+        graph.add_edge(first, second, weight)
+
+    for row in range(side):
+        for column in range(side):
+            if column + 1 < side:
+                connect(f'{row},{column}', f'{row},{column + 1}')
+            if row + 1 < side:
+                connect(f'{row},{column}', f'{row + 1},{column}')
+            if row + 1 < side and column + 1 < side and random.random() < 0.2:
+                connect(f'{row},{column}', f'{row + 1},{column + 1}')
+
+    return graph
+
+
+def main(side: int, query_count: int):
+    graph = build_grid(side)
+
+    # Stats give the amount of nodes each search settled
+    graph.enable_stats()
+
+    random.seed(1)
+    queries: List[Tuple[str, str]] = [
+        (f'{random.randrange(side)},{random.randrange(side)}', f'{random.randrange(side)},{random.randrange(side)}')
+        for _ in range(query_count)
+    ]
+
+    print(f'{side * side} nodes, {query_count} queries')
+    print(f'{"method":<16}{"settled/query":>15}{"ms/query":>12}')
+
+    for method in ['dijkstra', 'bidirectional', 'a_star']:
+        settled = 0
+        start = time.perf_counter()
+
+        for source, target in queries:
+            graph.get_shortest_path(source, target, method)
+            settled += graph.last_stats.nodes_settled
+
+        seconds = time.perf_counter() - start
+        print(f'{method:<16}{settled / query_count:>15.0f}{seconds / query_count * 1000:>12.2f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 50)
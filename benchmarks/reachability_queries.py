@@ -0,0 +1,65 @@
+"""
+Measures the throughput of "can A reach B" queries on a DirectedGraph that does not change:
+a lazy depth-first traversal per query, against the reachability index in both of its modes.
+
+Run from the repository root:
+    python -m benchmarks.reachability_queries [node count] [edges per node] [query count]
+"""
+import random
+import sys
+import time
+
+from graphs.directed_graph import DirectedGraph
+from graphs.reachability_index import ReachabilityIndex
+
+
+def build_graph(node_count: int, edges_per_node: int) -> DirectedGraph:
+    random.seed(0)
+
+    def edges():
+        for _ in range(node_count * edges_per_node):
+            first = random.randrange(node_count)
+            second = min(node_count - 1, first + random.randrange(1, 100))
+            if random.random() < 0.02:
+                first, second = second, first
+            yield f'n{first}', f'n{second}'
+
+    return DirectedGraph.from_edge_list(edges())
+
+
+def main(node_count: int, edges_per_node: int, query_count: int):
+    graph = build_graph(node_count, edges_per_node)
+    frozen = graph.freeze()
+
+    # Only nodes with at least one edge exist in a graph built from an edge list
+    random.seed(1)
+    queries = [(random.choice(frozen.labels), random.choice(frozen.labels)) for _ in range(query_count)]
+
+    print(f'{node_count} nodes, {node_count * edges_per_node} edges, {query_count} queries')
+    print(f'{"method":<32}{"build s":>10}{"queries/s":>14}')
+
+    # Traversals are far slower, so they only answer a sample of the queries
+    sample = queries[:max(1, query_count // 100)]
+    start = time.perf_counter()
+    for first, second in sample:
+        any(label == second for label in graph.traverse_depth_first_iterative(first))
+    seconds = time.perf_counter() - start
+    print(f'{"depth-first traversal":<32}{0:>10.3f}{len(sample) / seconds:>14.0f}')
+
+    for name, closure_limit in [('index, transitive closure', node_count), ('index, interval labels', 0)]:
+        start = time.perf_counter()
+        index = ReachabilityIndex(frozen, closure_limit)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for first, second in queries:
+            index.can_reach(first, second)
+        seconds = time.perf_counter() - start
+
+        print(f'{name:<32}{build:>10.3f}{query_count / seconds:>14.0f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 100_000)
@@ -0,0 +1,64 @@
+"""
+Measures strongly connected component detection and condensation on a large DirectedGraph.
+
+The graph is a random graph with mostly forward edges and some backward ones,
+which gives a mix of large components, small components and single nodes.
+
+Run from the repository root:
+    python -m benchmarks.strongly_connected_components [node count] [edge count]
+"""
+import random
+import sys
+import time
+
+from graphs.directed_graph import DirectedGraph
+
+
+def build_graph(node_count: int, edge_count: int) -> DirectedGraph:
+    random.seed(0)
+
+    def edges():
+        for _ in range(edge_count):
+            first = random.randrange(node_count)
+            second = min(node_count - 1, first + random.randrange(1, 50))
+            if random.random() < 0.05:
+                first, second = second, first
+            yield f'n{first}', f'n{second}'
+
+    return DirectedGraph.from_edge_list(edges())
+
+
+def main(node_count: int, edge_count: int):
+    graph = build_graph(node_count, edge_count)
+    print(f'{node_count} nodes, {edge_count} edges')
+
+    start = time.perf_counter()
+    frozen = graph.freeze()
+    print(f'{"freeze":<40}{time.perf_counter() - start:>10.3f} s')
+
+    start = time.perf_counter()
+    _, count = frozen.get_strongly_connected_components()
+    seconds = time.perf_counter() - start
+    print(f'{"FrozenGraph components":<40}{seconds:>10.3f} s{edge_count / seconds:>14.0f} edges/s')
+    print(f'{"":<40}{count:>10} components')
+
+    start = time.perf_counter()
+    frozen.get_condensation()
+    print(f'{"FrozenGraph condensation":<40}{time.perf_counter() - start:>10.3f} s')
+
+    start = time.perf_counter()
+    graph.get_strongly_connected_components()
+    print(f'{"DirectedGraph components":<40}{time.perf_counter() - start:>10.3f} s')
+
+    start = time.perf_counter()
+    condensation, _ = graph.get_condensation()
+    print(f'{"DirectedGraph condensation":<40}{time.perf_counter() - start:>10.3f} s')
+
+    start = time.perf_counter()
+    condensation.topological_sort()
+    print(f'{"topological_sort of condensation":<40}{time.perf_counter() - start:>10.3f} s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
@@ -2,11 +2,21 @@ from typing import List
 
 
 class Path:
-    __nodes: List[str] = []
+    __slots__ = ('__nodes',)
+    __nodes: List[str]
+
+    def __init__(self):
+        self.__nodes = []
 
     def add(self, node: str):
         self.__nodes.append(node)
 
+    @property
+    def nodes(self) -> List[str]:
+        return list(self.__nodes)
+
+    def __len__(self):
+        return len(self.__nodes)
+
     def __str__(self):
-        for label in self.__nodes:
-            print(label)
+        return " -> ".join(self.__nodes)
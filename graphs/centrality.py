@@ -0,0 +1,164 @@
+import itertools
+import operator
+from array import array
+from collections import Counter
+from typing import List, Tuple
+
+from graphs.frozen_graph import FrozenGraph
+
+# NumPy is optional. Without it, the same computations run on arrays in pure Python.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def pagerank(graph: FrozenGraph, damping: float = 0.85, tolerance: float = 1e-6, max_iterations: int = 100,
+             use_numpy: bool or None = None) -> Tuple[array, int]:
+    """
+    Calculates the PageRank of every node by power iteration.
+    In each iteration, every node passes its rank in equal shares along its outgoing edges. A node without
+    outgoing edges, a dangling node, passes its rank to every node instead, so no rank is lost.
+    A share of 1 - damping of the total rank is spread evenly over all nodes.
+    :param graph: is the frozen graph. An undirected graph is treated as having an edge in each direction.
+    :param damping: is the probability of following an edge, rather than jumping to a random node.
+    :param tolerance: is the sum of the absolute rank changes of an iteration, at or below which the ranks
+    have converged.
+    :param max_iterations: is the most iterations to run, converged or not.
+    :param use_numpy: is a boolean value determining if the iterations are vectorized with NumPy.
+    Defaults to using NumPy if it is installed.
+    :return: the rank of each node by id, summing to 1, and the amount of iterations run.
+    :raise AttributeError: if NumPy is requested, but not installed.
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise AttributeError("NumPy is not installed.")
+
+    if graph.node_count == 0:
+        return array('d'), 0
+
+    if use_numpy:
+        return _pagerank_numpy(graph, damping, tolerance, max_iterations)
+
+    return _pagerank_python(graph, damping, tolerance, max_iterations)
+
+
+def _pagerank_python(graph: FrozenGraph, damping: float, tolerance: float,
+                     max_iterations: int) -> Tuple[array, int]:
+    """
+    The pure-Python implementation detail of pagerank.
+    Instead of pushing shares along each edge in a Python loop, the edges are grouped by target node once,
+    so the rank of each node is the sum of a slice of shares, taken by the sum and map builtins in C.
+    """
+    count = graph.node_count
+    offsets = graph.offsets
+    targets = graph.targets
+
+    # Holds the source node of each edge, grouped by target node: the reverse of the CSR buffers
+    sources_by_position = [node for node in range(count) for _ in range(offsets[node + 1] - offsets[node])]
+    order = sorted(range(len(targets)), key=targets.__getitem__)
+    sources: List[int] = list(map(sources_by_position.__getitem__, order))
+
+    in_degrees = Counter(targets)
+    in_offsets: List[int] = list(itertools.accumulate((in_degrees.get(node, 0) for node in range(count)), initial=0))
+
+    # Multiplying by the inverse out-degree is the share of its rank a node passes along each edge
+    inverse_degrees: List[float] = [0.0] * count
+    dangling: List[int] = []
+    for node in range(count):
+        degree = offsets[node + 1] - offsets[node]
+        if degree == 0:
+            dangling.append(node)
+        else:
+            inverse_degrees[node] = 1 / degree
+
+    ranks: List[float] = [1 / count] * count
+    iterations = 0
+
+    while iterations < max_iterations:
+        iterations += 1
+
+        shares = list(map(operator.mul, ranks, inverse_degrees))
+        share_of = shares.__getitem__
+
+        # The rank of dangling nodes and the random jumps are the same for every node
+        base = (1 - damping) / count + damping * sum(map(ranks.__getitem__, dangling)) / count
+
+        new_ranks = [base + damping * sum(map(share_of, sources[in_offsets[node]:in_offsets[node + 1]]))
+                     for node in range(count)]
+
+        change = sum(map(abs, map(operator.sub, new_ranks, ranks)))
+        ranks = new_ranks
+
+        if change <= tolerance:
+            break
+
+    return array('d', ranks), iterations
+
+
+def _pagerank_numpy(graph: FrozenGraph, damping: float, tolerance: float,
+                    max_iterations: int) -> Tuple[array, int]:
+    """
+    The NumPy implementation detail of pagerank. The shares of all edges are gathered and summed per
+    target node by a single bincount per iteration.
+    """
+    count = graph.node_count
+    offsets = numpy.frombuffer(graph.offsets, dtype=numpy.int32)
+    targets = numpy.frombuffer(graph.targets, dtype=numpy.int32)
+
+    degrees = numpy.diff(offsets)
+    sources = numpy.repeat(numpy.arange(count, dtype=numpy.int32), degrees)
+
+    is_dangling = degrees == 0
+    inverse_degrees = numpy.zeros(count)
+    inverse_degrees[~is_dangling] = 1 / degrees[~is_dangling]
+
+    ranks = numpy.full(count, 1 / count)
+    iterations = 0
+
+    while iterations < max_iterations:
+        iterations += 1
+
+        shares = ranks * inverse_degrees
+        base = (1 - damping) / count + damping * ranks[is_dangling].sum() / count
+
+        new_ranks = base + damping * numpy.bincount(targets, weights=shares[sources], minlength=count)
+
+        change = numpy.abs(new_ranks - ranks).sum()
+        ranks = new_ranks
+
+        if change <= tolerance:
+            break
+
+    return array('d', ranks.tobytes()), iterations
+
+
+def in_degree_centrality(graph: FrozenGraph) -> array:
+    """
+    Calculates the in-degree centrality of every node: the fraction of the other nodes with an edge into it.
+    :param graph: is the frozen graph.
+    :return: the centrality of each node by id.
+    """
+    count = graph.node_count
+    scale = 1 / (count - 1) if count > 1 else 1.0
+
+    if numpy is not None:
+        degrees = numpy.bincount(numpy.frombuffer(graph.targets, dtype=numpy.int32), minlength=count)
+        return array('d', (degrees * scale).tobytes())
+
+    in_degrees = Counter(graph.targets)
+    return array('d', (in_degrees.get(node, 0) * scale for node in range(count)))
+
+
+def out_degree_centrality(graph: FrozenGraph) -> array:
+    """
+    Calculates the out-degree centrality of every node: the fraction of the other nodes it has an edge to.
+    :param graph: is the frozen graph.
+    :return: the centrality of each node by id.
+    """
+    count = graph.node_count
+    scale = 1 / (count - 1) if count > 1 else 1.0
+    offsets = graph.offsets
+
+    return array('d', ((offsets[node + 1] - offsets[node]) * scale for node in range(count)))
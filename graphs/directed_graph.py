@@ -1,8 +1,17 @@
-import random
-from typing import List, Dict, Set
+import time
+from array import array
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Set, Tuple
+
+from graphs.centrality import pagerank
+from graphs.edge_list import read_csv
+from graphs.frozen_graph import FrozenGraph
+from graphs.operation_stats import StatsRecorder
+from graphs.reachability_index import ReachabilityIndex
 
 
 class _Node:
+    __slots__ = ('__label',)
     __label: str
 
     def __init__(self, value: str):
@@ -16,37 +25,68 @@ class _Node:
         return self.__label
 
 
-class DirectedGraph:
+class DirectedGraph(StatsRecorder):
+    __slots__ = ('__nodes', '__adjacency_list', '__incoming', '__order', '__next_order', '__reachability_index')
+
     # Holds key: label, value: _Node object
-    __nodes: Dict[str, _Node] = {}
+    __nodes: Dict[str, _Node]
 
     # This implementation of an adjacency list is somewhat unconventional, but has the same runtime as
     # using an array of linked list objects.
-    __adjacency_list: Dict[_Node, List[_Node]] = {}
+    # The neighbors of each node are stored as the keys of a dictionary, which works as an
+    # insertion-ordered set: traversal order is preserved, and an edge is removed in O(1).
+    __adjacency_list: Dict[_Node, Dict[_Node, None]]
+
+    # The reverse adjacency list, holding the nodes with an edge into each node.
+    # This lets us remove a node by only touching its neighbors, instead of scanning every adjacency list.
+    __incoming: Dict[_Node, Dict[_Node, None]]
+
+    # Holds key: _Node object, value: position in the maintained topological order,
+    # or None when the order is not maintained. Positions are unique, but not necessarily contiguous.
+    __order: Dict[_Node, int] or None
+
+    # The position given to the next added node, which has no edges and can go last
+    __next_order: int
+
+    # Built on the first reachability query, and dropped on any change to the graph
+    __reachability_index: ReachabilityIndex or None
+
+    def __init__(self):
+        super().__init__()
+        self.__nodes = {}
+        self.__adjacency_list = {}
+        self.__incoming = {}
+        self.__order = None
+        self.__next_order = 0
+        self.__reachability_index = None
 
     def add_node(self, label: str):
         """
         Adds a node to the graph.
         :param label: is the label of the node.
         """
-        node = None
-
-        if label not in self.__nodes:
-            node = _Node(label)
-            self.__nodes[label] = node
-
         # This means that the label is already in self.__nodes
-        if node is None:
+        if label in self.__nodes:
             return
 
-        if node not in self.__adjacency_list:
-            self.__adjacency_list[node] = []
+        node = _Node(label)
+        self.__nodes[label] = node
+        self.__adjacency_list[node] = {}
+        self.__incoming[node] = {}
+        self.__reachability_index = None
+
+        if self.__order is not None:
+            self.__order[node] = self.__next_order
+            self.__next_order += 1
 
     def add_edge(self, first: str, second: str):
         """
         Adds a directed edge between two nodes in the graph.
+        Adding an edge that already exists has no effect.
+        Time complexity: O(1), unless the topological order is maintained and the edge goes against it.
         :param first: is the label of the first node.
         :param second: is the label of the second node.
+        :raise AttributeError: if the topological order is maintained and the edge would close a cycle.
         """
         first_node = self.__nodes.get(first)
         if first_node is None:
@@ -56,14 +96,20 @@ class DirectedGraph:
         if second_node is None:
             raise AttributeError("Second node is None.")
 
+        if self.__order is not None and second_node not in self.__adjacency_list[first_node]:
+            self.__reorder(first_node, second_node)
+
         # Add second node to first node's adjacency list
         # Note that this causes us to have a directed graph,
         # because the relationship is not unidirectional.
-        self.__adjacency_list.get(first_node).append(second_node)
+        self.__adjacency_list[first_node][second_node] = None
+        self.__incoming[second_node][first_node] = None
+        self.__reachability_index = None
 
     def remove_node(self, label: str):
         """
         Removes a node from the graph.
+        Time complexity: O(deg), because only the node's own neighbors are touched.
         :param label: is the label of the node to remove.
         """
 
@@ -72,19 +118,28 @@ class DirectedGraph:
         if node is None:
             return
 
-        # Remove node's relationships
-        for n in self.__adjacency_list.keys():
-            connections = self.__adjacency_list.get(n)
-            if node in connections:
-                connections.remove(node)
+        # Remove node's outgoing relationships from its targets' incoming sets
+        for adjacent_node in self.__adjacency_list[node]:
+            self.__incoming[adjacent_node].pop(node, None)
+
+        # Remove node's incoming relationships from its sources' adjacency sets
+        for adjacent_node in self.__incoming[node]:
+            self.__adjacency_list[adjacent_node].pop(node, None)
 
         # Remove node
         self.__adjacency_list.pop(node)
+        self.__incoming.pop(node)
         self.__nodes.pop(label)
+        self.__reachability_index = None
+
+        # Removing a node leaves a gap in the positions, which does not break the order
+        if self.__order is not None:
+            self.__order.pop(node)
 
     def remove_edge(self, first: str, second: str):
         """
         Removes a directed edge between two nodes in the graph.
+        Time complexity: O(1).
         :param first: is the label of the first node.
         :param second: is the label of the second node.
         """
@@ -97,7 +152,262 @@ class DirectedGraph:
             return
 
         # Remove relationship from first_node to second_node
-        self.__adjacency_list[first_node].remove(second_node)
+        self.__adjacency_list[first_node].pop(second_node, None)
+        self.__incoming[second_node].pop(first_node, None)
+        self.__reachability_index = None
+
+    def can_reach(self, first: str, second: str) -> bool:
+        """
+        Checks if there is a path from the first node to the second node. A node always reaches itself.
+        The first query builds a ReachabilityIndex in O(V + E), which answers later queries without
+        traversing the graph, until the graph changes.
+        :param first: is the label of the first node.
+        :param second: is the label of the second node.
+        :return: a boolean value determining if the first node reaches the second node.
+        :raise AttributeError: if a node does not exist.
+        """
+        return self.get_reachability_index().can_reach(first, second)
+
+    def get_reachability_index(self) -> ReachabilityIndex:
+        """
+        Gets the reachability index of the graph, building it if the graph has changed since it was last built.
+        :return: the reachability index.
+        """
+        if self.__reachability_index is None:
+            self.__reachability_index = ReachabilityIndex(self.freeze())
+
+        return self.__reachability_index
+
+    def get_pagerank(self, damping: float = 0.85, tolerance: float = 1e-6,
+                     max_iterations: int = 100) -> Dict[str, float]:
+        """
+        Calculates the PageRank of every node, over a frozen snapshot of the graph. See centrality.pagerank.
+        :param damping: is the probability of following an edge, rather than jumping to a random node.
+        :param tolerance: is the sum of the absolute rank changes at or below which the ranks have converged.
+        :param max_iterations: is the most iterations to run, converged or not.
+        :return: a dictionary with key: label, value: rank. The ranks sum to 1.
+        """
+        frozen = self.freeze()
+        ranks, _ = pagerank(frozen, damping, tolerance, max_iterations)
+
+        return dict(zip(frozen.labels, ranks))
+
+    def get_in_degree_centrality(self) -> Dict[str, float]:
+        """
+        Calculates the in-degree centrality of every node: the fraction of the other nodes with an edge into it.
+        The reverse adjacency list already holds the in-degrees, so this is O(V).
+        :return: a dictionary with key: label, value: centrality.
+        """
+        scale = 1 / (len(self.__nodes) - 1) if len(self.__nodes) > 1 else 1.0
+        return dict((label, len(self.__incoming[node]) * scale) for label, node in self.__nodes.items())
+
+    def get_out_degree_centrality(self) -> Dict[str, float]:
+        """
+        Calculates the out-degree centrality of every node: the fraction of the other nodes it has an edge to.
+        :return: a dictionary with key: label, value: centrality.
+        """
+        scale = 1 / (len(self.__nodes) - 1) if len(self.__nodes) > 1 else 1.0
+        return dict((label, len(self.__adjacency_list[node]) * scale) for label, node in self.__nodes.items())
+
+    def maintain_topological_order(self, enabled: bool = True):
+        """
+        Starts or stops maintaining a topological order as the graph changes.
+        While maintained, add_edge keeps the order up to date using the Pearce-Kelly algorithm,
+        and rejects any edge that would close a cycle. Only the nodes between the two ends of an edge
+        that goes against the current order are visited, instead of recomputing the whole order.
+        :param enabled: is a boolean value determining if the order should be maintained.
+        :raise AttributeError: if the graph already has a cycle.
+        """
+        if not enabled:
+            self.__order = None
+            return
+
+        if self.__order is not None:
+            return
+
+        levels, remaining = self.__remove_sources()
+        if len(remaining) > 0:
+            cycle = self.__find_cycle_in(remaining)
+            raise AttributeError(f'Graph has a cycle: {" -> ".join(cycle)}.')
+
+        self.__order = {}
+        for level in levels:
+            for label in level:
+                self.__order[self.__nodes[label]] = len(self.__order)
+
+        self.__next_order = len(self.__order)
+
+    def get_topological_order(self) -> List[str]:
+        """
+        Gets the node labels in topologically sorted order.
+        If the order is maintained, this only sorts the maintained positions.
+        Otherwise, it falls back to topological_sort.
+        :return: a list of the node labels, in topologically sorted order.
+        """
+        if self.__order is None:
+            return self.topological_sort()
+
+        order = self.__order
+        return [node.label for node in sorted(order, key=order.get)]
+
+    def __reorder(self, first_node: _Node, second_node: _Node):
+        """
+        The implementation detail of the Pearce-Kelly algorithm, called before adding the edge first -> second.
+        If first already comes before second, nothing needs to change. Otherwise, only the nodes whose position
+        lies between the two ends of the edge can be affected:
+
+            forward: the nodes reachable from second, positioned before first.
+            backward: the nodes that reach first, positioned after second.
+
+        The positions of both sets are pooled and handed out again, backward nodes first,
+        each set keeping its relative order.
+        :param first_node: is the source of the new edge.
+        :param second_node: is the target of the new edge.
+        :raise AttributeError: if the edge would close a cycle, in which case nothing is changed.
+        """
+        order = self.__order
+        lower = order[second_node]
+        upper = order[first_node]
+
+        if lower > upper:
+            return
+
+        # A forward search from second that reaches first means the new edge closes a cycle
+        forward: List[_Node] = self.__collect(second_node, self.__adjacency_list, lambda n: order[n] <= upper)
+        if first_node in forward:
+            raise AttributeError(f'Edge {first_node} -> {second_node} would close a cycle.')
+
+        backward: List[_Node] = self.__collect(first_node, self.__incoming, lambda n: order[n] > lower)
+
+        forward.sort(key=order.get)
+        backward.sort(key=order.get)
+
+        positions: List[int] = sorted(order[node] for node in backward + forward)
+        for node, position in zip(backward + forward, positions):
+            order[node] = position
+
+    @staticmethod
+    def __collect(start: _Node, adjacency_list: Dict[_Node, Dict[_Node, None]],
+                  within: Callable[[_Node], bool]) -> List[_Node]:
+        """
+        Collects the nodes reachable from a start node, only passing through nodes within the affected region.
+        :param start: is the start node, which is always collected.
+        :param adjacency_list: is the forward or the reverse adjacency list to follow.
+        :param within: is a predicate determining if a node lies within the affected region.
+        :return: the collected nodes.
+        """
+        visited: Set[_Node] = {start}
+        stack: List[_Node] = [start]
+
+        while len(stack) > 0:
+            current = stack.pop()
+            for adjacent_node in adjacency_list[current]:
+                if adjacent_node not in visited and within(adjacent_node):
+                    visited.add(adjacent_node)
+                    stack.append(adjacent_node)
+
+        return list(visited)
+
+    @staticmethod
+    def from_edge_list(edges: Iterable[tuple]) -> 'DirectedGraph':
+        """
+        Builds a graph from a stream of edges in one pass, creating nodes as they first appear.
+        Nodes and edges are written straight into the containers of the new graph, which does not maintain
+        a topological order or a reachability index yet, so the calls and checks of add_node and add_edge
+        are skipped.
+        :param edges: are (first, second) tuples of node labels. Any further items, such as a weight, are ignored.
+        :return: the new graph.
+        """
+        graph = DirectedGraph()
+
+        nodes = graph.__nodes
+        adjacency_list = graph.__adjacency_list
+        incoming = graph.__incoming
+
+        for edge in edges:
+            first_node = nodes.get(edge[0])
+            if first_node is None:
+                first_node = _Node(edge[0])
+                nodes[edge[0]] = first_node
+                adjacency_list[first_node] = {}
+                incoming[first_node] = {}
+
+            second_node = nodes.get(edge[1])
+            if second_node is None:
+                second_node = _Node(edge[1])
+                nodes[edge[1]] = second_node
+                adjacency_list[second_node] = {}
+                incoming[second_node] = {}
+
+            adjacency_list[first_node][second_node] = None
+            incoming[second_node][first_node] = None
+
+        return graph
+
+    @staticmethod
+    def from_csv(path: str, delimiter: str = ',', has_header: bool = False) -> 'DirectedGraph':
+        """
+        Builds a graph from a CSV file holding one edge per row, streaming the file instead of reading it at once.
+        :param path: is the path of the file.
+        :param delimiter: is the column delimiter.
+        :param has_header: is a boolean value determining if the first row should be skipped.
+        :return: the new graph.
+        """
+        return DirectedGraph.from_edge_list(read_csv(path, delimiter, has_header))
+
+    def save(self, path: str):
+        """
+        Saves the graph to a binary snapshot file. See FrozenGraph.save for the format.
+        :param path: is the path of the file to write.
+        """
+        self.freeze().save(path)
+
+    @staticmethod
+    def load(path: str) -> 'DirectedGraph':
+        """
+        Loads a graph from a binary snapshot file.
+        Use FrozenGraph.load instead for a memory-mapped graph, which loads in a fraction of the time.
+        :param path: is the path of the file to read.
+        :return: the new graph.
+        """
+        frozen = FrozenGraph.load(path)
+
+        graph = DirectedGraph()
+        for label in frozen.labels:
+            graph.add_node(label)
+
+        nodes: List[_Node] = list(graph.__nodes.values())
+        offsets = frozen.offsets
+        targets = frozen.targets
+
+        for index, node in enumerate(nodes):
+            connections = graph.__adjacency_list[node]
+            for position in range(offsets[index], offsets[index + 1]):
+                adjacent_node = nodes[targets[position]]
+                connections[adjacent_node] = None
+                graph.__incoming[adjacent_node][node] = None
+
+        return graph
+
+    def freeze(self) -> FrozenGraph:
+        """
+        Compiles the graph into an immutable, compact FrozenGraph.
+        Labels are packed into an integer id map, and the adjacency list into flat array buffers,
+        which costs a few bytes per edge instead of a Python object per edge.
+        Later changes to this graph are not reflected in the frozen graph.
+        :return: the frozen graph.
+        """
+        labels: List[str] = list(self.__nodes.keys())
+        ids: Dict[_Node, int] = dict((node, index) for index, node in enumerate(self.__nodes.values()))
+
+        offsets = array('i', [0])
+        targets = array('i')
+
+        for node in self.__nodes.values():
+            targets.extend(ids[adjacent_node] for adjacent_node in self.__adjacency_list[node])
+            offsets.append(len(targets))
+
+        return FrozenGraph(labels, offsets, targets, None, directed=True)
 
     def print(self):
         """
@@ -116,48 +426,94 @@ class DirectedGraph:
                 print(f'{connection}', end=" ")
             print()
 
-    def traverse_breadth_first(self, start_node_label: str):
+    def traverse_breadth_first(self, start_node_label: str, max_depth: int or None = None,
+                               max_nodes: int or None = None,
+                               stop: Callable[[str, int], bool] or None = None) -> Iterator[Tuple[str, int]]:
         """
         Traverses the graph using the breadth-first algorithm.
-        Implemented using a queue and a set of visited nodes.
+        Implemented using a double-ended queue and a set of visited nodes.
+        The traversal is lazy, so a caller that stops iterating early never touches the rest of the graph.
+        With stats enabled, it is recorded once it ends or is closed, so its time includes the time the caller
+        spent between nodes.
         :param start_node_label: is the label of the start node.
+        :param max_depth: is the maximum distance, in edges, from the start node. Defaults to no limit.
+        :param max_nodes: is the maximum amount of nodes to visit. Defaults to no limit.
+        :param stop: is a predicate taking the label and depth of a visited node.
+        The traversal ends right after the first node for which it returns True.
+        :return: a generator of (label, depth) pairs, in the order the nodes are visited.
         """
         if start_node_label not in self.__nodes:
             return
 
-        queue: List[_Node] = []
+        if max_nodes is not None and max_nodes <= 0:
+            return
+
+        stats_enabled = self.stats_enabled
+        start = time.perf_counter() if stats_enabled else 0.0
+
+        queue: Deque[Tuple[_Node, int]] = deque()
         visited: Set[_Node] = set()
 
         node = self.__nodes[start_node_label]
-        queue.insert(0, node)
+        queue.append((node, 0))
 
-        while len(queue) > 0:
-            # Remove first occurrence of current node
-            current = queue.pop(0)
+        # Mark nodes as visited when they are enqueued, so each node enters the queue only once
+        visited.add(node)
 
-            # Node has already been visited
-            if current in visited:
-                continue
+        count = 0
+        relaxed = 0
+        peak = 1
 
-            # Visit current node
-            print(f'Current node: {current}')
-            visited.add(node)
+        try:
+            while len(queue) > 0:
+                current, depth = queue.popleft()
 
-            # Visit adjacent nodes
-            connections = self.__adjacency_list[node]
-            for adjacent_node in connections:
-                if adjacent_node not in visited:
-                    queue.append(adjacent_node)
+                # Visit current node
+                yield current.label, depth
+                count += 1
+
+                if max_nodes is not None and count >= max_nodes:
+                    return
+
+                if stop is not None and stop(current.label, depth):
+                    return
+
+                # The adjacent nodes are beyond the depth limit
+                if max_depth is not None and depth >= max_depth:
+                    continue
 
-    def traverse_depth_first_iterative(self, start_node_label: str):
+                # Visit adjacent nodes
+                connections = self.__adjacency_list[current]
+                if stats_enabled:
+                    relaxed += len(connections)
+
+                for adjacent_node in connections:
+                    if adjacent_node not in visited:
+                        visited.add(adjacent_node)
+                        queue.append((adjacent_node, depth + 1))
+
+                if stats_enabled and len(queue) > peak:
+                    peak = len(queue)
+        finally:
+            # Each visited node was pushed once, and popped once if it was visited
+            if stats_enabled:
+                self._record("traverse_breadth_first", start, count, relaxed, len(visited), count, peak)
+
+    def traverse_depth_first_iterative(self, start_node_label: str) -> Iterator[str]:
         """
         An iterative implementation of the depth-first traversal algorithm.
         Implemented using a stack and a set of visited nodes.
+        The traversal is lazy, so a caller that stops iterating early never touches the rest of the graph.
+        With stats enabled, it is recorded once it ends or is closed, as traverse_breadth_first is.
         :param start_node_label: is the label of the start node.
+        :return: a generator of node labels, in the order they are visited.
         """
         if start_node_label not in self.__nodes:
             return
 
+        stats_enabled = self.stats_enabled
+        start = time.perf_counter() if stats_enabled else 0.0
+
         # Initialize stack that holds nodes in graph
         stack: List[_Node] = []
 
@@ -167,28 +523,102 @@ class DirectedGraph:
         current = self.__nodes[start_node_label]
         stack.append(current)
 
-        # While we still have nodes to visit
-        while len(stack) > 0:
-            current: _Node = stack.pop()
+        pops = 0
+        relaxed = 0
+        peak = 1
 
-            # Node has already been visited
-            if current in visited:
-                continue
+        try:
+            # While we still have nodes to visit
+            while len(stack) > 0:
+                current: _Node = stack.pop()
 
-            # Visit node
-            print(f'Current node: {current}')
-            visited.add(current)
+                if stats_enabled:
+                    pops += 1
 
-            # Visit adjacent nodes
-            connections = self.__adjacency_list[current]
-            for adjacent_node in connections:
-                if adjacent_node not in visited:
-                    stack.append(adjacent_node)
+                # Node has already been visited
+                if current in visited:
+                    continue
+
+                # Visit node
+                visited.add(current)
+                yield current.label
+
+                # Visit adjacent nodes
+                connections = self.__adjacency_list[current]
+                if stats_enabled:
+                    relaxed += len(connections)
+
+                for adjacent_node in connections:
+                    if adjacent_node not in visited:
+                        stack.append(adjacent_node)
+
+                if stats_enabled and len(stack) > peak:
+                    peak = len(stack)
+        finally:
+            if stats_enabled:
+                self._record("traverse_depth_first", start, len(visited), relaxed, pops + len(stack), pops, peak)
 
     def topological_sort(self) -> List[str]:
         """
         Calculates a topological sort of the graph.
         We use topological sorting when one entity depends on one or more other entities.
+        This visits nodes in the same order as topological_sort_recursive, but uses an explicit stack
+        of (node, iterator over its adjacent nodes) pairs, so deep graphs never hit the recursion limit.
+        :return: a list of the node labels, in topologically sorted order.
+        """
+        stats_enabled = self.stats_enabled
+        start = time.perf_counter() if stats_enabled else 0.0
+
+        # Holds the nodes in the order their dependencies have been handled
+        stack: List[_Node] = []
+
+        # We use a set to determine if we have visited a given node
+        visited: Set[_Node] = set()
+
+        # The deepest the path of nodes being handled has been
+        peak = min(1, len(self.__nodes))
+
+        for root in self.__nodes.values():
+            if root in visited:
+                continue
+
+            visited.add(root)
+            path: List[Tuple[_Node, Iterator[_Node]]] = [(root, iter(self.__adjacency_list[root]))]
+
+            while len(path) > 0:
+                node, connections = path[-1]
+
+                adjacent_node = next(connections, None)
+
+                # Every dependency of this node has been handled
+                if adjacent_node is None:
+                    path.pop()
+                    stack.append(node)
+                    continue
+
+                if adjacent_node not in visited:
+                    visited.add(adjacent_node)
+                    path.append((adjacent_node, iter(self.__adjacency_list[adjacent_node])))
+
+                    if stats_enabled and len(path) > peak:
+                        peak = len(path)
+
+        # Pop items off the stack and add them in order of topological sort
+        sorted: List[str] = []
+        while len(stack) > 0:
+            sorted.append(stack.pop().label)
+
+        # Every node is pushed onto and popped off the path once, after looking at each of its edges
+        if stats_enabled:
+            edge_count = sum(len(connections) for connections in self.__adjacency_list.values())
+            self._record("topological_sort", start, len(sorted), edge_count, len(sorted), len(sorted), peak)
+
+        return sorted
+
+    def topological_sort_recursive(self) -> List[str]:
+        """
+        Calculates a topological sort of the graph, using recursion.
+        Kept for comparison with topological_sort; it hits the recursion limit on deep graphs.
         :return: a list of the node labels, in topologically sorted order.
         """
         # Initialize stack that holds nodes in graph
@@ -207,6 +637,89 @@ class DirectedGraph:
 
         return sorted
 
+    def get_topological_levels(self) -> List[List[str]]:
+        """
+        Groups the nodes into levels using Kahn's algorithm.
+        The first level holds the nodes without incoming edges, and every other node is placed one level
+        after the last of the nodes it depends on. The nodes within a level do not depend on each other,
+        so each level can be processed in parallel once the previous levels are done.
+        :return: a list of levels, each holding node labels.
+        :raise AttributeError: if the graph has a cycle, naming the nodes of one cycle.
+        """
+        levels, remaining = self.__remove_sources()
+
+        if len(remaining) > 0:
+            cycle = self.__find_cycle_in(remaining)
+            raise AttributeError(f'Graph has a cycle: {" -> ".join(cycle)}.')
+
+        return levels
+
+    def find_cycle(self) -> List[str] or None:
+        """
+        Finds a cycle in the graph, using Kahn's algorithm.
+        Nodes without incoming edges cannot be part of a cycle, so they are removed until none are left.
+        Every remaining node then has a remaining predecessor, and walking backwards through
+        the predecessors must eventually repeat a node.
+        Example: A -> B -> C -> A gives [A, B, C, A].
+        :return: the labels of the nodes in a cycle, starting and ending with the same node, or None.
+        """
+        _, remaining = self.__remove_sources()
+
+        if len(remaining) == 0:
+            return None
+
+        return self.__find_cycle_in(remaining)
+
+    def __remove_sources(self) -> Tuple[List[List[str]], Dict[_Node, int]]:
+        """
+        The implementation detail of Kahn's algorithm.
+        Repeatedly removes the nodes without incoming edges, one level at a time.
+        :return: the levels of removed node labels, and the remaining in-degree of the nodes that could not be removed.
+        """
+        in_degree: Dict[_Node, int] = dict((node, len(self.__incoming[node])) for node in self.__nodes.values())
+
+        level: List[_Node] = [node for node, degree in in_degree.items() if degree == 0]
+        levels: List[List[str]] = []
+
+        while len(level) > 0:
+            levels.append([node.label for node in level])
+            next_level: List[_Node] = []
+
+            for node in level:
+                del in_degree[node]
+
+                for adjacent_node in self.__adjacency_list[node]:
+                    in_degree[adjacent_node] -= 1
+                    if in_degree[adjacent_node] == 0:
+                        next_level.append(adjacent_node)
+
+            level = next_level
+
+        return levels, in_degree
+
+    def __find_cycle_in(self, remaining: Dict[_Node, int]) -> List[str]:
+        """
+        Walks backwards through remaining predecessors until a node repeats.
+        :param remaining: holds the nodes that Kahn's algorithm could not remove.
+        :return: the labels of the nodes in the cycle, in edge order, starting and ending with the same node.
+        """
+        # Holds key: node, value: position in the walk
+        positions: Dict[_Node, int] = {}
+        walk: List[_Node] = []
+
+        current = next(iter(remaining))
+        while current not in positions:
+            positions[current] = len(walk)
+            walk.append(current)
+            current = next(node for node in self.__incoming[current] if node in remaining)
+
+        # The walk follows edges backwards, so reverse the cycle to follow them forwards
+        cycle = walk[positions[current]:]
+        cycle.append(current)
+        cycle.reverse()
+
+        return [node.label for node in cycle]
+
     def __topological_sort(self, node: _Node, stack: List[_Node], visited: Set[_Node]):
         """
         The implementation detail of the topological sort, implemented using recursion.
@@ -257,13 +770,98 @@ class DirectedGraph:
             if adjacent_node not in visited:
                 self.__traverse_depth_first(adjacent_node, visited)
 
+    def get_strongly_connected_components(self) -> List[List[str]]:
+        """
+        Finds the strongly connected components of the graph, that is, the groups of nodes that can all reach
+        each other. A node that is not part of any cycle is a component of its own.
+        Uses Tarjan's algorithm on a frozen copy of the graph, in linear time and without recursion.
+        Example: A -> B -> A -> C gives [[A, B], [C]].
+        :return: a list of components, each holding node labels. The components are in topological order:
+        every edge between two components goes from an earlier to a later one.
+        """
+        frozen = self.freeze()
+        components, count = frozen.get_strongly_connected_components()
+
+        groups: List[List[str]] = [[] for _ in range(count)]
+        for label, component in zip(frozen.labels, components):
+            groups[component].append(label)
+
+        return groups
+
+    def get_condensation(self) -> Tuple['DirectedGraph', List[List[str]]]:
+        """
+        Builds the condensation of the graph, where each strongly connected component is contracted into one node.
+        The condensation is always acyclic, so it can be ordered with topological_sort even when this graph
+        has cycles.
+        :return: the condensation, whose node labels are component indices as strings, and the components,
+        where the component at index i holds the labels of the nodes contracted into node str(i).
+        """
+        frozen = self.freeze()
+        condensed, components = frozen.get_condensation()
+
+        groups: List[List[str]] = [[] for _ in range(condensed.node_count)]
+        for label, component in zip(frozen.labels, components):
+            groups[component].append(label)
+
+        graph = DirectedGraph()
+        for label in condensed.labels:
+            graph.add_node(label)
+
+        offsets = condensed.offsets
+        targets = condensed.targets
+        for component, label in enumerate(condensed.labels):
+            for position in range(offsets[component], offsets[component + 1]):
+                graph.add_edge(label, condensed.labels[targets[position]])
+
+        return graph, groups
+
     def has_cycle(self) -> bool:
         """
         Checks if the directed graph has a cycle.
-        A depth-first search is used to search for a cycle.
+        A depth-first search is used to search for a cycle, with an explicit stack instead of recursion.
         Example: A -> B -> C -> A is a cyclic directed graph.
         :return: a boolean value determining if the directed graph is cyclic.
         """
+        # Holds the nodes we currently visit, that is, the nodes on the current depth-first path
+        visiting: Set[_Node] = set()
+        visited: Set[_Node] = set()
+
+        for root in self.__nodes.values():
+            if root in visited:
+                continue
+
+            visiting.add(root)
+            path: List[Tuple[_Node, Iterator[_Node]]] = [(root, iter(self.__adjacency_list[root]))]
+
+            while len(path) > 0:
+                node, connections = path[-1]
+
+                adjacent_node = next(connections, None)
+
+                if adjacent_node is None:
+                    path.pop()
+                    visiting.remove(node)
+                    visited.add(node)
+                    continue
+
+                if adjacent_node in visited:
+                    continue
+
+                # We have a cycle if the adjacent node is in the visiting set
+                if adjacent_node in visiting:
+                    return True
+
+                visiting.add(adjacent_node)
+                path.append((adjacent_node, iter(self.__adjacency_list[adjacent_node])))
+
+        return False
+
+    def has_cycle_recursive(self) -> bool:
+        """
+        Checks if the directed graph has a cycle, using a recursive depth-first search.
+        Kept for comparison with has_cycle; it hits the recursion limit on deep graphs.
+        :return: a boolean value determining if the directed graph is cyclic.
+        """
 
         # Add all existing nodes
         all: Set[_Node] = set(self.__nodes.values())
@@ -272,8 +870,8 @@ class DirectedGraph:
         visited: Set[_Node] = set()
 
         while len(all) > 0:
-            # Gets a random node to start the depth
-            current: _Node = random.choice(list(all))
+            # Gets any node not yet visited to start the depth-first search
+            current: _Node = next(iter(all))
             if self.__has_cycle(current, all, visiting, visited):
                 return True
 
@@ -281,14 +879,13 @@ class DirectedGraph:
 
     def __has_cycle(self, node: _Node, all: Set[_Node], visiting: Set[_Node], visited: Set[_Node]) -> bool:
         """
-        The implementation detail of the has_cycle method.
+        The implementation detail of the has_cycle_recursive method.
         :param node: is the current node.
         :param all: is the set of all nodes in the graph.
         :param visiting: is the set of the nodes we currently visit.
         :param visited: is the set of already visited nodes.
         :return: a boolean value determining if the graph is cyclic.
         """
-        print(f'Current node: {node}')
         all.remove(node)
         visiting.add(node)
 
@@ -325,3 +922,4 @@ if __name__ == '__main__':
     # graph.print()
     has_cycle = graph.has_cycle()
     print(has_cycle)
+    print(graph.find_cycle())
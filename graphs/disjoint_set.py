@@ -0,0 +1,109 @@
+from array import array
+
+
+class DisjointSet:
+    """
+    A disjoint-set, also called union-find, over the integer ids 0 to size - 1.
+    Every id starts in a set of its own. Sets are stored as trees in a flat parent array,
+    where the root of each tree identifies its set.
+
+    Union by rank keeps the trees shallow, and path compression flattens them further on every find,
+    which makes both operations run in near-constant amortized time.
+    """
+    __slots__ = ('__parent', '__rank', '__count')
+
+    __parent: array
+    __rank: array
+    __count: int
+
+    def __init__(self, size: int = 0):
+        """
+        Creates a disjoint-set where every id is in a set of its own.
+        :param size: is the amount of ids.
+        :raise AttributeError: if the size is less than 0.
+        """
+        if size < 0:
+            raise AttributeError("Size must not be negative.")
+
+        self.__parent = array('i', range(size))
+
+        # A rank is an upper bound of the tree height, which never exceeds log2(size)
+        self.__rank = array('B', bytes(size))
+        self.__count = size
+
+    @property
+    def size(self) -> int:
+        return len(self.__parent)
+
+    @property
+    def count(self) -> int:
+        """
+        Gets the amount of disjoint sets.
+        """
+        return self.__count
+
+    def add(self) -> int:
+        """
+        Adds a new id in a set of its own.
+        :return: the new id.
+        """
+        id = len(self.__parent)
+        self.__parent.append(id)
+        self.__rank.append(0)
+        self.__count += 1
+
+        return id
+
+    def find(self, id: int) -> int:
+        """
+        Finds the root of the set holding an id.
+        Every id on the way is then pointed directly to the root, so later finds are faster.
+        :param id: is the id.
+        :return: the root id of the set.
+        """
+        parent = self.__parent
+
+        root = id
+        while parent[root] != root:
+            root = parent[root]
+
+        # Path compression
+        while parent[id] != root:
+            parent[id], id = root, parent[id]
+
+        return root
+
+    def union(self, first: int, second: int) -> bool:
+        """
+        Merges the sets holding two ids.
+        The root of the shallower tree is attached to the root of the deeper one.
+        :param first: is the first id.
+        :param second: is the second id.
+        :return: True if the sets were merged, or False if both ids were already in the same set.
+        """
+        first_root = self.find(first)
+        second_root = self.find(second)
+
+        if first_root == second_root:
+            return False
+
+        rank = self.__rank
+        if rank[first_root] < rank[second_root]:
+            first_root, second_root = second_root, first_root
+
+        self.__parent[second_root] = first_root
+        if rank[first_root] == rank[second_root]:
+            rank[first_root] += 1
+
+        self.__count -= 1
+
+        return True
+
+    def connected(self, first: int, second: int) -> bool:
+        """
+        Checks if two ids are in the same set.
+        :param first: is the first id.
+        :param second: is the second id.
+        :return: a boolean value determining if the ids are in the same set.
+        """
+        return self.find(first) == self.find(second)
@@ -0,0 +1,27 @@
+import csv
+from typing import Iterator
+
+
+def read_csv(path: str, delimiter: str = ',', has_header: bool = False) -> Iterator[tuple]:
+    """
+    Streams the edges of a CSV file, one row at a time.
+    Each row holds a first label, a second label and optionally a weight.
+    :param path: is the path of the file.
+    :param delimiter: is the column delimiter.
+    :param has_header: is a boolean value determining if the first row should be skipped.
+    :return: a generator of (first, second) or (first, second, weight) tuples.
+    :raise AttributeError: if a row does not have two or three columns.
+    """
+    with open(path, newline='', encoding='utf-8') as file:
+        reader = csv.reader(file, delimiter=delimiter)
+
+        if has_header:
+            next(reader, None)
+
+        for row in reader:
+            if len(row) == 2:
+                yield row[0], row[1]
+            elif len(row) == 3:
+                yield row[0], row[1], float(row[2])
+            elif len(row) != 0:
+                raise AttributeError(f'Line {reader.line_num} must hold two or three columns.')
@@ -0,0 +1,649 @@
+import heapq
+import mmap
+import struct
+import sys
+from array import array
+from collections import deque
+from typing import Callable, Deque, Dict, Iterator, List, Set, Tuple
+
+from graphs.Path import Path
+
+# The snapshot header: magic, version, byte order, directed, weighted, node count, edge count, label table size
+_SNAPSHOT_HEADER = struct.Struct('<4sHBBBxqqq')
+_SNAPSHOT_MAGIC = b'CSRG'
+_SNAPSHOT_VERSION = 1
+
+# Every section of a snapshot starts at a multiple of 8 bytes, so the arrays can be memory-mapped in place
+_SNAPSHOT_ALIGNMENT = 8
+
+
+class FrozenGraph:
+    """
+    An immutable, compact snapshot of a graph in compressed sparse row (CSR) format.
+    Instead of one Python object per node and per edge, each label is mapped to an integer id,
+    and the adjacency list is packed into three flat buffers:
+
+        offsets: the edges of node i are stored at positions offsets[i] to offsets[i + 1] - 1.
+        targets: the id of the target node of each edge.
+        weights: the weight of each edge, or None for an unweighted graph.
+
+    Example: A -> B, A -> C, C -> B is stored as
+        labels  = [A, B, C]
+        offsets = [0, 2, 2, 3]
+        targets = [1, 2, 1]
+
+    An undirected graph stores each edge once in each direction, just like its mutable counterpart.
+    """
+    __slots__ = ('__labels', '__ids', '__offsets', '__targets', '__weights', '__directed', '__has_negative_weights')
+
+    __labels: List[str]
+    __ids: Dict[str, int]
+    __offsets: array
+    __targets: array
+    __weights: array or None
+    __directed: bool
+
+    # Determines if any edge has a negative weight, which Dijkstra's algorithm cannot handle
+    __has_negative_weights: bool
+
+    def __init__(self, labels: List[str], offsets: array, targets: array, weights: array or None = None,
+                 directed: bool = True):
+        """
+        Creates a frozen graph from already packed buffers.
+        Use DirectedGraph.freeze() or WeightedGraph.freeze() rather than calling this directly.
+        :param labels: is the label of each node, indexed by node id.
+        :param offsets: is an array('i') of length len(labels) + 1.
+        :param targets: is an array('i') holding the target node id of each edge.
+        :param weights: is an array('d') holding the weight of each edge, or None for an unweighted graph.
+        Memoryviews cast to the same type codes may be used instead of arrays, as FrozenGraph.load does.
+        :param directed: is a boolean value determining if the graph is directed.
+        :raise AttributeError: if the buffers are inconsistent.
+        """
+        if len(offsets) != len(labels) + 1:
+            raise AttributeError("Offsets must hold exactly one more entry than labels.")
+
+        if weights is not None and len(weights) != len(targets):
+            raise AttributeError("Weights must hold exactly one entry per edge.")
+
+        self.__labels = labels
+        self.__ids = dict((label, index) for index, label in enumerate(labels))
+        self.__offsets = offsets
+        self.__targets = targets
+        self.__weights = weights
+        self.__directed = directed
+        self.__has_negative_weights = weights is not None and len(weights) > 0 and min(weights) < 0
+
+    @property
+    def labels(self) -> List[str]:
+        return self.__labels
+
+    @property
+    def offsets(self) -> array:
+        return self.__offsets
+
+    @property
+    def targets(self) -> array:
+        return self.__targets
+
+    @property
+    def weights(self) -> array or None:
+        return self.__weights
+
+    @property
+    def directed(self) -> bool:
+        return self.__directed
+
+    @property
+    def has_negative_weights(self) -> bool:
+        """
+        Gets a boolean value determining if any edge has a negative weight.
+        Shortest paths cannot be calculated on the frozen graph then, as it only runs Dijkstra's algorithm.
+        """
+        return self.__has_negative_weights
+
+    @property
+    def node_count(self) -> int:
+        return len(self.__labels)
+
+    @property
+    def edge_count(self) -> int:
+        """
+        Gets the amount of stored edges. An undirected edge is stored, and counted, twice.
+        """
+        return len(self.__targets)
+
+    def index_of(self, label: str) -> int:
+        """
+        Gets the integer id of a node.
+        :param label: is the label of the node.
+        :return: the id of the node, or -1 if it does not exist.
+        """
+        return self.__ids.get(label, -1)
+
+    def save(self, path: str):
+        """
+        Saves the graph to a binary snapshot file, with the following sections:
+
+            header: see _SNAPSHOT_HEADER.
+            label offsets: an array('q') of length node_count + 1, into the label table.
+            label table: the UTF-8 encoded labels, back to back.
+            offsets, targets and weights: the packed buffers, exactly as they are held in memory.
+
+        Nothing else is saved: the node positions of a WeightedGraph are not part of a frozen graph,
+        and weights are stored as they are packed, as floats.
+        :param path: is the path of the file to write.
+        """
+        encoded: List[bytes] = [label.encode('utf-8') for label in self.__labels]
+
+        label_offsets = array('q', [0])
+        position = 0
+        for label in encoded:
+            position += len(label)
+            label_offsets.append(position)
+
+        header = _SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, 0 if sys.byteorder == 'little' else 1,
+                                       self.__directed, self.__weights is not None,
+                                       len(self.__labels), len(self.__targets), position)
+
+        sections = [label_offsets, b''.join(encoded), self.__offsets, self.__targets]
+        if self.__weights is not None:
+            sections.append(self.__weights)
+
+        with open(path, 'wb') as file:
+            file.write(header)
+            written = len(header)
+
+            for section in sections:
+                written += file.write(bytes(-written % _SNAPSHOT_ALIGNMENT))
+                written += file.write(section if isinstance(section, bytes) else memoryview(section).cast('B'))
+
+    @staticmethod
+    def load(path: str, memory_map: bool = True):
+        """
+        Loads a graph from a binary snapshot file written by save.
+        With memory mapping, the offsets, targets and weights are read directly from the file as they are used,
+        so loading only costs decoding the labels, however many edges the graph has.
+        :param path: is the path of the file to read.
+        :param memory_map: is a boolean value determining if the packed buffers are memory-mapped
+        instead of read into memory.
+        :return: the frozen graph.
+        :raise AttributeError: if the file is not a snapshot.
+        """
+        with open(path, 'rb') as file:
+            if memory_map:
+                data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                data = memoryview(file.read())
+
+        if len(data) < _SNAPSHOT_HEADER.size:
+            raise AttributeError("File is not a graph snapshot.")
+
+        magic, version, byte_order, directed, weighted, node_count, edge_count, label_size = \
+            _SNAPSHOT_HEADER.unpack_from(data)
+
+        if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+            raise AttributeError("File is not a graph snapshot, or was written by another version.")
+
+        # A snapshot written on a machine with the other byte order must be copied and swapped
+        swap = byte_order != (0 if sys.byteorder == 'little' else 1)
+
+        position = _SNAPSHOT_HEADER.size
+
+        def read(typecode: str or None, length: int):
+            nonlocal position
+            position += -position % _SNAPSHOT_ALIGNMENT
+
+            size = length * (array(typecode).itemsize if typecode is not None else 1)
+            section = data[position:position + size]
+            position += size
+
+            if typecode is None:
+                return section
+
+            if swap:
+                copy = array(typecode)
+                copy.frombytes(section)
+                copy.byteswap()
+                return copy
+
+            return section.cast(typecode)
+
+        label_offsets = read('q', node_count + 1)
+        table = read(None, label_size)
+        labels = [str(table[label_offsets[i]:label_offsets[i + 1]], 'utf-8') for i in range(node_count)]
+
+        offsets = read('i', node_count + 1)
+        targets = read('i', edge_count)
+        weights = read('d', edge_count) if weighted else None
+
+        return FrozenGraph(labels, offsets, targets, weights, bool(directed))
+
+    def traverse_breadth_first(self, start_node_label: str, max_depth: int or None = None,
+                               max_nodes: int or None = None,
+                               stop: Callable[[str, int], bool] or None = None) -> Iterator[Tuple[str, int]]:
+        """
+        Traverses the graph using the breadth-first algorithm, directly on the packed buffers.
+        Takes the same limits as DirectedGraph.traverse_breadth_first.
+        :param start_node_label: is the label of the start node.
+        :param max_depth: is the maximum distance, in edges, from the start node. Defaults to no limit.
+        :param max_nodes: is the maximum amount of nodes to visit. Defaults to no limit.
+        :param stop: is a predicate taking the label and depth of a visited node.
+        The traversal ends right after the first node for which it returns True.
+        :return: a generator of (label, depth) pairs, in the order the nodes are visited.
+        """
+        start = self.__ids.get(start_node_label)
+        if start is None:
+            return
+
+        if max_nodes is not None and max_nodes <= 0:
+            return
+
+        offsets = self.__offsets
+        targets = self.__targets
+        labels = self.__labels
+
+        visited = bytearray(len(labels))
+        visited[start] = 1
+
+        queue: Deque[Tuple[int, int]] = deque()
+        queue.append((start, 0))
+        count = 0
+
+        while len(queue) > 0:
+            current, depth = queue.popleft()
+
+            yield labels[current], depth
+            count += 1
+
+            if max_nodes is not None and count >= max_nodes:
+                return
+
+            if stop is not None and stop(labels[current], depth):
+                return
+
+            if max_depth is not None and depth >= max_depth:
+                continue
+
+            for i in range(offsets[current], offsets[current + 1]):
+                adjacent = targets[i]
+                if not visited[adjacent]:
+                    visited[adjacent] = 1
+                    queue.append((adjacent, depth + 1))
+
+    def traverse_depth_first_iterative(self, start_node_label: str) -> Iterator[str]:
+        """
+        Traverses the graph using the depth-first algorithm, directly on the packed buffers.
+        :param start_node_label: is the label of the start node.
+        :return: a generator of node labels, in the order they are visited.
+        """
+        start = self.__ids.get(start_node_label)
+        if start is None:
+            return
+
+        offsets = self.__offsets
+        targets = self.__targets
+        labels = self.__labels
+
+        visited = bytearray(len(labels))
+        stack = [start]
+
+        while len(stack) > 0:
+            current = stack.pop()
+
+            if visited[current]:
+                continue
+
+            visited[current] = 1
+            yield labels[current]
+
+            for i in range(offsets[current], offsets[current + 1]):
+                if not visited[targets[i]]:
+                    stack.append(targets[i])
+
+    def topological_sort(self) -> List[str]:
+        """
+        Calculates a topological sort of the graph.
+        This visits nodes in the same order as DirectedGraph.topological_sort,
+        but uses an explicit stack of (node, next edge position) pairs instead of recursion.
+        :return: a list of the node labels, in topologically sorted order.
+        """
+        offsets = self.__offsets
+        targets = self.__targets
+        labels = self.__labels
+
+        visited = bytearray(len(labels))
+        order: List[int] = []
+
+        for root in range(len(labels)):
+            if visited[root]:
+                continue
+
+            visited[root] = 1
+            stack = [(root, offsets[root])]
+
+            while len(stack) > 0:
+                node, position = stack[-1]
+
+                if position == offsets[node + 1]:
+                    # Every dependency of this node has been handled
+                    stack.pop()
+                    order.append(node)
+                    continue
+
+                stack[-1] = (node, position + 1)
+
+                adjacent = targets[position]
+                if not visited[adjacent]:
+                    visited[adjacent] = 1
+                    stack.append((adjacent, offsets[adjacent]))
+
+        return [labels[node] for node in reversed(order)]
+
+    def get_strongly_connected_components(self) -> Tuple[array, int]:
+        """
+        Finds the strongly connected components of the graph, using Tarjan's algorithm with an explicit stack.
+        Two nodes are in the same component if each can reach the other.
+        Every node gets an index, in the order it is discovered, and a low link: the lowest index reachable
+        from it through the nodes still on the component stack. A node whose low link equals its own index
+        is the root of a component, made up of itself and the nodes above it on the component stack.
+        Time complexity: O(V + E).
+        :return: an array('i') holding the component id of each node id, and the amount of components.
+        Component ids are in topological order: every edge between two components goes from a lower to a higher id.
+        """
+        offsets = self.__offsets
+        targets = self.__targets
+        size = len(self.__labels)
+
+        index = array('i', [-1]) * size
+        low = array('i', [0]) * size
+        on_stack = bytearray(size)
+        components = array('i', [-1]) * size
+
+        # Holds the nodes of the components that are not yet complete
+        stack: List[int] = []
+        counter = 0
+        component_count = 0
+
+        for root in range(size):
+            if index[root] != -1:
+                continue
+
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+
+            # Replaces the recursion, holding (node, next edge position) pairs
+            path = [(root, offsets[root])]
+
+            while len(path) > 0:
+                node, position = path[-1]
+
+                if position < offsets[node + 1]:
+                    path[-1] = (node, position + 1)
+                    adjacent = targets[position]
+
+                    if index[adjacent] == -1:
+                        index[adjacent] = low[adjacent] = counter
+                        counter += 1
+                        stack.append(adjacent)
+                        on_stack[adjacent] = 1
+                        path.append((adjacent, offsets[adjacent]))
+                    elif on_stack[adjacent] and index[adjacent] < low[node]:
+                        low[node] = index[adjacent]
+                    continue
+
+                # Every edge of this node has been handled, so return to the node we came from
+                path.pop()
+                if len(path) > 0:
+                    parent = path[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+
+                if low[node] == index[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        components[member] = component_count
+                        if member == node:
+                            break
+                    component_count += 1
+
+        # Tarjan's algorithm completes every component after the components it reaches,
+        # so reversing the ids gives a topological order
+        last = component_count - 1
+        for node in range(size):
+            components[node] = last - components[node]
+
+        return components, component_count
+
+    def get_condensation(self) -> Tuple['FrozenGraph', array]:
+        """
+        Builds the condensation of the graph, where each strongly connected component is contracted into one node.
+        The condensation is always acyclic. Its node labels are the component ids, as strings,
+        and it holds one edge for every pair of components connected by at least one edge.
+        :return: the condensation, and an array('i') holding the component id of each node id.
+        """
+        components, count = self.get_strongly_connected_components()
+
+        offsets = self.__offsets
+        targets = self.__targets
+
+        # Holds every edge between two components, packed into a single integer
+        pairs: Set[int] = set()
+        for node in range(len(self.__labels)):
+            component = components[node]
+            for position in range(offsets[node], offsets[node + 1]):
+                adjacent_component = components[targets[position]]
+                if adjacent_component != component:
+                    pairs.add(component * count + adjacent_component)
+
+        condensed_offsets = array('i', [0]) * (count + 1)
+        condensed_targets = array('i')
+
+        # Sorting the packed pairs groups the edges by source component, which is exactly the CSR layout
+        for pair in sorted(pairs):
+            condensed_offsets[pair // count + 1] += 1
+            condensed_targets.append(pair % count)
+
+        for component in range(count):
+            condensed_offsets[component + 1] += condensed_offsets[component]
+
+        labels = [str(component) for component in range(count)]
+
+        return FrozenGraph(labels, condensed_offsets, condensed_targets, None, directed=True), components
+
+    def has_cycle(self) -> bool:
+        """
+        Checks if the graph has a cycle.
+        For a directed graph, a depth-first search looks for an edge back to a node that is still being visited.
+        For an undirected graph, it looks for an edge to an already visited node, other than the one we came from.
+        :return: a boolean value determining if the graph is cyclic.
+        """
+        if self.__directed:
+            return self.__has_directed_cycle()
+
+        return self.__has_undirected_cycle()
+
+    def __has_directed_cycle(self) -> bool:
+        offsets = self.__offsets
+        targets = self.__targets
+
+        # 0: not visited, 1: visiting, 2: visited
+        state = bytearray(len(self.__labels))
+
+        for root in range(len(self.__labels)):
+            if state[root]:
+                continue
+
+            state[root] = 1
+            stack = [(root, offsets[root])]
+
+            while len(stack) > 0:
+                node, position = stack[-1]
+
+                if position == offsets[node + 1]:
+                    stack.pop()
+                    state[node] = 2
+                    continue
+
+                stack[-1] = (node, position + 1)
+
+                adjacent = targets[position]
+
+                # We have a cycle if the adjacent node is still being visited
+                if state[adjacent] == 1:
+                    return True
+
+                if state[adjacent] == 0:
+                    state[adjacent] = 1
+                    stack.append((adjacent, offsets[adjacent]))
+
+        return False
+
+    def __has_undirected_cycle(self) -> bool:
+        offsets = self.__offsets
+        targets = self.__targets
+
+        visited = bytearray(len(self.__labels))
+
+        for root in range(len(self.__labels)):
+            if visited[root]:
+                continue
+
+            visited[root] = 1
+
+            # Holds (node, previous node) pairs
+            stack = [(root, -1)]
+
+            while len(stack) > 0:
+                node, previous = stack.pop()
+
+                for i in range(offsets[node], offsets[node + 1]):
+                    adjacent = targets[i]
+
+                    # In this case, this target node is the one we came from
+                    if adjacent == previous:
+                        continue
+
+                    if visited[adjacent]:
+                        return True
+
+                    visited[adjacent] = 1
+                    stack.append((adjacent, node))
+
+        return False
+
+    def get_shortest_path(self, source: str, target: str) -> Path:
+        """
+        Calculates the shortest path between two nodes using Dijkstra's algorithm on the packed buffers.
+        An unweighted graph uses a weight of 1 for every edge.
+        :param source: is the label of the source node.
+        :param target: is the label of the target node.
+        :return: the shortest path between source and target node, or an empty path if target is unreachable.
+        :raise AttributeError: if a node does not exist, or any edge has a negative weight.
+        """
+        source_id = self.__ids.get(source)
+        if source_id is None:
+            raise AttributeError("Source node does not exist.")
+
+        target_id = self.__ids.get(target)
+        if target_id is None:
+            raise AttributeError("Target node does not exist.")
+
+        distances, previous = self.__dijkstra(source_id, target_id)
+
+        path = Path()
+        if distances[target_id] == float('inf'):
+            return path
+
+        stack: List[int] = [target_id]
+        while previous[stack[-1]] != -1:
+            stack.append(previous[stack[-1]])
+
+        while len(stack) > 0:
+            path.add(self.__labels[stack.pop()])
+
+        return path
+
+    def get_shortest_distances(self, source: str) -> Dict[str, float]:
+        """
+        Calculates the shortest distance from a source node to every node reachable from it.
+        :param source: is the label of the source node.
+        :return: a dictionary with key: label, value: shortest distance from the source node.
+        :raise AttributeError: if the node does not exist, or any edge has a negative weight.
+        """
+        source_id = self.__ids.get(source)
+        if source_id is None:
+            raise AttributeError("Source node does not exist.")
+
+        distances, _ = self.__dijkstra(source_id, -1)
+        infinity = float('inf')
+
+        return dict((self.__labels[node], distance) for node, distance in enumerate(distances)
+                    if distance != infinity)
+
+    def get_distance_array(self, source_id: int) -> array:
+        """
+        Calculates the shortest distance from a source node to every node, by node id.
+        This is the compact form of get_shortest_distances, used where results are shipped between processes.
+        :param source_id: is the id of the source node.
+        :return: an array('d') holding the distance to each node id, or infinity if it is unreachable.
+        :raise AttributeError: if the node does not exist, or any edge has a negative weight.
+        """
+        if not 0 <= source_id < len(self.__labels):
+            raise AttributeError("Source node does not exist.")
+
+        distances, _ = self.__dijkstra(source_id, -1)
+
+        return distances
+
+    def __dijkstra(self, source: int, target: int) -> (array, array):
+        """
+        The implementation detail of Dijkstra's algorithm, using a binary heap with lazy deletion.
+        Heap entries are (distance, node id) tuples, which compare without any tie-breaker.
+        :param source: is the id of the source node.
+        :param target: is the id of the node to stop at once settled, or -1 to settle every reachable node.
+        :return: the distance array and the previous node array, indexed by node id.
+        :raise AttributeError: if any edge has a negative weight.
+        """
+        # Dijkstra's algorithm would silently return wrong distances. Use WeightedGraph, which runs Bellman-Ford.
+        if self.__has_negative_weights:
+            raise AttributeError("Shortest paths on a frozen graph require non-negative weights.")
+
+        offsets = self.__offsets
+        targets = self.__targets
+        weights = self.__weights
+
+        size = len(self.__labels)
+        distances = array('d', [float('inf')]) * size
+        previous = array('i', [-1]) * size
+        settled = bytearray(size)
+
+        distances[source] = 0
+        priority_queue = [(0.0, source)]
+
+        while len(priority_queue) > 0:
+            distance, current = heapq.heappop(priority_queue)
+
+            if settled[current]:
+                continue
+
+            settled[current] = 1
+
+            if current == target:
+                break
+
+            for i in range(offsets[current], offsets[current + 1]):
+                adjacent = targets[i]
+                if settled[adjacent]:
+                    continue
+
+                next_distance = distance + (weights[i] if weights is not None else 1)
+
+                if next_distance < distances[adjacent]:
+                    distances[adjacent] = next_distance
+                    previous[adjacent] = current
+                    heapq.heappush(priority_queue, (next_distance, adjacent))
+
+        return distances, previous
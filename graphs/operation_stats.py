@@ -0,0 +1,151 @@
+import time
+from typing import Callable
+
+
+class OperationStats:
+    """
+    Holds the amount of work done by a single call of a graph algorithm, such as a shortest-path search.
+    Counters that do not apply to an algorithm, such as heap operations for a traversal without a heap, are 0.
+    """
+    __slots__ = ('__operation', '__nodes_settled', '__edges_relaxed', '__heap_pushes', '__heap_pops',
+                 '__peak_frontier', '__seconds')
+
+    __operation: str
+    __nodes_settled: int
+    __edges_relaxed: int
+    __heap_pushes: int
+    __heap_pops: int
+    __peak_frontier: int
+    __seconds: float
+
+    def __init__(self, operation: str, nodes_settled: int = 0, edges_relaxed: int = 0, heap_pushes: int = 0,
+                 heap_pops: int = 0, peak_frontier: int = 0, seconds: float = 0.0):
+        """
+        Creates the stats of a call.
+        :param operation: is the name of the algorithm, such as "dijkstra" or "topological_sort".
+        :param nodes_settled: is the amount of nodes whose result was final, or that were visited.
+        :param edges_relaxed: is the amount of edges looked at.
+        :param heap_pushes: is the amount of entries pushed onto the heap, queue or stack of the algorithm.
+        :param heap_pops: is the amount of entries popped from it, including outdated entries that were skipped.
+        :param peak_frontier: is the largest amount of entries it held at once.
+        :param seconds: is the wall time of the call.
+        """
+        self.__operation = operation
+        self.__nodes_settled = nodes_settled
+        self.__edges_relaxed = edges_relaxed
+        self.__heap_pushes = heap_pushes
+        self.__heap_pops = heap_pops
+        self.__peak_frontier = peak_frontier
+        self.__seconds = seconds
+
+    @property
+    def operation(self) -> str:
+        return self.__operation
+
+    @property
+    def nodes_settled(self) -> int:
+        return self.__nodes_settled
+
+    @property
+    def edges_relaxed(self) -> int:
+        return self.__edges_relaxed
+
+    @property
+    def heap_pushes(self) -> int:
+        return self.__heap_pushes
+
+    @property
+    def heap_pops(self) -> int:
+        return self.__heap_pops
+
+    @property
+    def peak_frontier(self) -> int:
+        return self.__peak_frontier
+
+    @property
+    def seconds(self) -> float:
+        return self.__seconds
+
+    def as_dict(self) -> dict:
+        """
+        Gets the stats as a dictionary, for exporting them to a metrics system.
+        :return: a dictionary with key: stat name, value: stat value.
+        """
+        return {
+            'operation': self.__operation,
+            'nodes_settled': self.__nodes_settled,
+            'edges_relaxed': self.__edges_relaxed,
+            'heap_pushes': self.__heap_pushes,
+            'heap_pops': self.__heap_pops,
+            'peak_frontier': self.__peak_frontier,
+            'seconds': self.__seconds,
+        }
+
+    def __str__(self):
+        return (f'{self.__operation}: {self.__nodes_settled} nodes settled, {self.__edges_relaxed} edges relaxed, '
+                f'{self.__heap_pushes} pushes, {self.__heap_pops} pops, peak frontier {self.__peak_frontier}, '
+                f'{self.__seconds * 1000:.3f} ms')
+
+
+class StatsRecorder:
+    """
+    The part of a graph class that records the work done by its algorithm calls as OperationStats.
+    Recording is off by default. An algorithm reads stats_enabled once when it starts, and only while it is set
+    does it time itself, count its work and call _record when it ends. While it is off, an algorithm
+    creates and calls nothing for its stats, and only checks that local flag where it would count.
+    """
+    __slots__ = ('__stats_enabled', '__stats_callback', '__last_stats')
+
+    # Determines if the work done by each call of an algorithm is recorded, the function to pass it to,
+    # and the stats of the last recorded call
+    __stats_enabled: bool
+    __stats_callback: Callable[[OperationStats], None] or None
+    __last_stats: OperationStats or None
+
+    def __init__(self):
+        self.__stats_enabled = False
+        self.__stats_callback = None
+        self.__last_stats = None
+
+    @property
+    def stats_enabled(self) -> bool:
+        """
+        Gets a boolean value determining if algorithm calls are being recorded.
+        """
+        return self.__stats_enabled
+
+    @property
+    def last_stats(self) -> OperationStats or None:
+        """
+        Gets the stats of the last recorded algorithm call, or None if nothing has been recorded.
+        """
+        return self.__last_stats
+
+    def enable_stats(self, callback: Callable[[OperationStats], None] or None = None):
+        """
+        Starts recording the work done by each algorithm call: nodes settled or visited, edges relaxed or
+        looked at, heap, queue or stack pushes and pops, peak frontier size, and wall time.
+        :param callback: is called with the stats of each call as soon as it finishes, such as to export
+        them to a metrics system. Defaults to only keeping the stats of the last call in last_stats.
+        """
+        self.__stats_enabled = True
+        self.__stats_callback = callback
+
+    def disable_stats(self):
+        """
+        Stops recording the work done by algorithm calls. The stats of the last recorded call are kept.
+        """
+        self.__stats_enabled = False
+        self.__stats_callback = None
+
+    def _record(self, operation: str, start: float, nodes_settled: int = 0, edges_relaxed: int = 0,
+                heap_pushes: int = 0, heap_pops: int = 0, peak_frontier: int = 0):
+        """
+        Records the stats of a finished algorithm call, and passes them to the callback.
+        :param start: is the time.perf_counter() value from the start of the call.
+        """
+        self.__last_stats = OperationStats(operation, nodes_settled, edges_relaxed, heap_pushes, heap_pops,
+                                           peak_frontier, time.perf_counter() - start)
+
+        if self.__stats_callback is not None:
+            self.__stats_callback(self.__last_stats)
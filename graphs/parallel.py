@@ -0,0 +1,275 @@
+import os
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from graphs.frozen_graph import FrozenGraph
+
+
+class _SharedGraph:
+    """
+    Copies the buffers of a FrozenGraph into shared memory blocks, so worker processes can read the graph
+    without it being pickled for every task. Only the block names, the labels and the buffer lengths
+    are sent to each worker, once, when it starts.
+    Use as a context manager; the blocks are released when it exits.
+    """
+    __slots__ = ('__blocks', '__arguments')
+
+    __blocks: List[SharedMemory]
+    __arguments: tuple
+
+    def __init__(self, graph: FrozenGraph):
+        self.__blocks = []
+
+        offsets = self.__share(graph.offsets)
+        targets = self.__share(graph.targets)
+        weights = self.__share(graph.weights) if graph.weights is not None else None
+
+        self.__arguments = (graph.labels, offsets, targets, weights, graph.directed)
+
+    def __share(self, buffer) -> Tuple[str, str, int]:
+        """
+        Copies a buffer into a new shared memory block.
+        :param buffer: is the buffer to copy: an array, or a typed memoryview, such as those of a loaded snapshot.
+        :return: the name of the block, the type code and the length of the buffer.
+        """
+        view = memoryview(buffer)
+        size = view.nbytes
+
+        # A shared memory block must not be empty
+        block = SharedMemory(create=True, size=max(size, 1))
+        block.buf[:size] = view.cast('B')
+        self.__blocks.append(block)
+
+        return block.name, view.format, len(view)
+
+    @property
+    def arguments(self) -> tuple:
+        """
+        Gets the arguments to pass to attach in a worker process.
+        """
+        return self.__arguments
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        for block in self.__blocks:
+            block.close()
+            block.unlink()
+
+    @staticmethod
+    def attach(labels: List[str], offsets: tuple, targets: tuple, weights: tuple or None,
+               directed: bool) -> Tuple[FrozenGraph, List[SharedMemory]]:
+        """
+        Attaches to the shared memory blocks from a worker process, without copying them.
+        :return: a FrozenGraph reading directly from the blocks, and the blocks, which must be kept open.
+        """
+        blocks: List[SharedMemory] = []
+
+        def view(shared: tuple or None):
+            if shared is None:
+                return None
+
+            name, typecode, length = shared
+            block = SharedMemory(name=name)
+            blocks.append(block)
+
+            return block.buf[:length * array(typecode).itemsize].cast(typecode)
+
+        graph = FrozenGraph(labels, view(offsets), view(targets), view(weights), directed)
+
+        return graph, blocks
+
+
+# Holds the graph attached by the current worker process, and the shared memory blocks it reads from
+_worker_graph: FrozenGraph or None = None
+_worker_blocks: List[SharedMemory] = []
+
+
+def _initialize_worker(*arguments):
+    global _worker_graph, _worker_blocks
+    _worker_graph, _worker_blocks = _SharedGraph.attach(*arguments)
+
+
+# Holds the visited bitmap of a breadth-first search, attached by the current worker process.
+# Workers only read it; the main process sets the bits between levels, while no worker is running.
+_worker_visited: memoryview or None = None
+
+
+def _initialize_breadth_first_worker(visited_name: str, *arguments):
+    global _worker_visited
+    _initialize_worker(*arguments)
+
+    block = SharedMemory(name=visited_name)
+    _worker_blocks.append(block)
+    _worker_visited = block.buf
+
+
+def _single_source(source_id: int) -> Tuple[int, bytes]:
+    # The distances travel back as raw bytes, which pickle far more compactly than a dictionary
+    return source_id, _worker_graph.get_distance_array(source_id).tobytes()
+
+
+def all_pairs_shortest_paths(graph: FrozenGraph, sources: Iterable[str] or None = None,
+                             workers: int or None = None) -> Iterator[Tuple[str, Dict[str, float]]]:
+    """
+    Calculates the shortest distances from many source nodes, running one single-source Dijkstra's algorithm
+    per source across a pool of worker processes.
+    The graph is placed in shared memory once, and every worker reads it from there.
+    Results are yielded as soon as each source is finished, so they do not arrive in the order of the sources.
+    :param graph: is the frozen graph.
+    :param sources: are the labels of the source nodes. Defaults to every node, giving all pairs.
+    :param workers: is the amount of worker processes. Defaults to the amount of CPUs.
+    :return: a generator of (source label, dictionary with key: label, value: shortest distance) pairs,
+    holding only the reachable nodes.
+    :raise AttributeError: if a source node does not exist, or any edge has a negative weight.
+    """
+    if graph.has_negative_weights:
+        raise AttributeError("Parallel shortest paths require non-negative weights.")
+
+    if sources is None:
+        source_ids: List[int] = list(range(graph.node_count))
+    else:
+        source_ids = []
+        for label in sources:
+            source_id = graph.index_of(label)
+            if source_id == -1:
+                raise AttributeError(f'Source node {label} does not exist.')
+            source_ids.append(source_id)
+
+    if len(source_ids) == 0:
+        return
+
+    labels = graph.labels
+    infinity = float('inf')
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with _SharedGraph(graph) as shared, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker,
+                                initargs=shared.arguments) as executor:
+
+        # Keep a bounded amount of tasks in flight, so millions of sources do not become millions of futures
+        in_flight_limit = workers * 4
+        pending: Set[Future] = set()
+        position = 0
+
+        while position < len(source_ids) or len(pending) > 0:
+            while position < len(source_ids) and len(pending) < in_flight_limit:
+                pending.add(executor.submit(_single_source, source_ids[position]))
+                position += 1
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                source_id, data = future.result()
+
+                distances = array('d')
+                distances.frombytes(data)
+
+                yield labels[source_id], dict((label, distance) for label, distance in zip(labels, distances)
+                                              if distance != infinity)
+
+
+def _expand(graph: FrozenGraph, visited, frontier: array) -> array:
+    """
+    Finds the unvisited nodes adjacent to a part of the frontier of a breadth-first search.
+    :param graph: is the frozen graph.
+    :param visited: is the visited bitmap, one bit per node id.
+    :param frontier: are the ids of the nodes to expand.
+    :return: the ids of the unvisited adjacent nodes, each once.
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+
+    found = array('i')
+    seen: Set[int] = set()
+
+    for node in frontier:
+        for adjacent in targets[offsets[node]:offsets[node + 1]]:
+            if not (visited[adjacent >> 3] >> (adjacent & 7)) & 1 and adjacent not in seen:
+                seen.add(adjacent)
+                found.append(adjacent)
+
+    return found
+
+
+def _expand_in_worker(frontier: bytes) -> bytes:
+    nodes = array('i')
+    nodes.frombytes(frontier)
+    return _expand(_worker_graph, _worker_visited, nodes).tobytes()
+
+
+def breadth_first_depths(graph: FrozenGraph, start: str, workers: int or None = None,
+                         parallel_threshold: int = 4096) -> array:
+    """
+    Calculates the depth, in edges, of every node reachable from a start node, by a level-synchronous
+    breadth-first search across a pool of worker processes.
+    The search handles one level at a time. Each frontier is split into parts that the workers expand
+    in parallel, reading the graph and a bitmap of the visited nodes from shared memory. The main process
+    then sets the bits of the newly found nodes, which also removes nodes found by more than one worker,
+    and their depths form the next frontier. Frontiers smaller than the threshold are expanded by the main
+    process alone, as sending them to the workers would cost more than it saves.
+    :param graph: is the frozen graph.
+    :param start: is the label of the start node.
+    :param workers: is the amount of worker processes. Defaults to the amount of CPUs.
+    :param parallel_threshold: is the smallest frontier, in nodes, that is expanded by the workers.
+    :return: the depth of each node by id, or -1 for nodes that are not reachable.
+    :raise AttributeError: if the start node does not exist.
+    """
+    start_id = graph.index_of(start)
+    if start_id == -1:
+        raise AttributeError("Start node does not exist.")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    count = graph.node_count
+    depths = array('i', [-1]) * count
+
+    # A new shared memory block is filled with zeros, so no node starts out visited
+    block = SharedMemory(create=True, size=max((count + 7) // 8, 1))
+    visited = block.buf
+
+    try:
+        with _SharedGraph(graph) as shared, \
+                ProcessPoolExecutor(max_workers=workers, initializer=_initialize_breadth_first_worker,
+                                    initargs=(block.name, *shared.arguments)) as executor:
+
+            depths[start_id] = 0
+            visited[start_id >> 3] |= 1 << (start_id & 7)
+            frontier = array('i', [start_id])
+            depth = 0
+
+            while len(frontier) > 0:
+                depth += 1
+
+                if len(frontier) < parallel_threshold:
+                    parts = [_expand(graph, visited, frontier)]
+                else:
+                    # Several parts per worker even out the work of frontiers with uneven degrees
+                    size = -(-len(frontier) // (workers * 4))
+                    futures = [executor.submit(_expand_in_worker, frontier[i:i + size].tobytes())
+                               for i in range(0, len(frontier), size)]
+
+                    parts = []
+                    for future in futures:
+                        part = array('i')
+                        part.frombytes(future.result())
+                        parts.append(part)
+
+                frontier = array('i')
+                for part in parts:
+                    for node in part:
+                        if not (visited[node >> 3] >> (node & 7)) & 1:
+                            visited[node >> 3] |= 1 << (node & 7)
+                            depths[node] = depth
+                            frontier.append(node)
+    finally:
+        block.close()
+        block.unlink()
+
+    return depths
@@ -0,0 +1,209 @@
+from array import array
+from typing import List
+
+from graphs.frozen_graph import FrozenGraph
+
+
+class ReachabilityIndex:
+    """
+    Answers "can A reach B" queries on a directed graph that does not change,
+    without traversing the graph for every query.
+
+    Every node in a strongly connected component reaches the same nodes, so the index is built on
+    the condensation, where each component is a single node and the graph is acyclic.
+    Component ids are in topological order, so a component can only reach components with a higher id.
+
+    For graphs with up to closure_limit components, the index holds the full transitive closure
+    as one row of bits per component, and every query is a single bit lookup.
+
+    For larger graphs the closure would not fit in memory, so the index holds three labels per component:
+
+        interval: the post-order numbers of a depth-first spanning forest. If the interval of B lies within
+        the interval of A, then B is a descendant of A in the forest, so A reaches B.
+        highest: the highest component id reachable from a component. Nothing above it can be reached.
+
+    Most queries are answered by these labels in O(1). The rest fall back to a depth-first search that
+    skips every component the labels rule out.
+    """
+    __slots__ = ('__ids', '__components', '__offsets', '__targets', '__row_size', '__closure',
+                 '__low', '__post', '__highest')
+
+    __ids: dict
+    __components: array
+    __offsets: array
+    __targets: array
+    __row_size: int
+    __closure: bytearray or None
+    __low: array or None
+    __post: array or None
+    __highest: array or None
+
+    def __init__(self, graph: FrozenGraph, closure_limit: int = 16_384):
+        """
+        Builds the index.
+        :param graph: is the frozen, directed graph.
+        :param closure_limit: is the highest amount of components for which the full transitive closure is held.
+        It takes closure_limit^2 / 8 bytes, 32 MB by default.
+        :raise AttributeError: if the graph is undirected.
+        """
+        if not graph.directed:
+            raise AttributeError("Reachability index requires a directed graph.")
+
+        condensation, components = graph.get_condensation()
+
+        self.__ids = dict((label, index) for index, label in enumerate(graph.labels))
+        self.__components = components
+        self.__offsets = condensation.offsets
+        self.__targets = condensation.targets
+
+        self.__row_size = 0
+        self.__closure = None
+        self.__low = None
+        self.__post = None
+        self.__highest = None
+
+        if condensation.node_count <= closure_limit:
+            self.__build_closure(condensation.node_count)
+        else:
+            self.__build_labels(condensation.node_count)
+
+    @property
+    def uses_closure(self) -> bool:
+        """
+        Gets a boolean value determining if the index holds the full transitive closure.
+        """
+        return self.__closure is not None
+
+    def can_reach(self, first: str, second: str) -> bool:
+        """
+        Checks if there is a path from the first node to the second node. A node always reaches itself.
+        :param first: is the label of the first node.
+        :param second: is the label of the second node.
+        :return: a boolean value determining if the first node reaches the second node.
+        :raise AttributeError: if a node does not exist.
+        """
+        first_id = self.__ids.get(first)
+        if first_id is None:
+            raise AttributeError("First node does not exist.")
+
+        second_id = self.__ids.get(second)
+        if second_id is None:
+            raise AttributeError("Second node does not exist.")
+
+        source = self.__components[first_id]
+        target = self.__components[second_id]
+
+        if self.__closure is not None:
+            return (self.__closure[source * self.__row_size + (target >> 3)] >> (target & 7)) & 1 == 1
+
+        return self.__reaches(source, target)
+
+    def __build_closure(self, count: int):
+        """
+        Builds the transitive closure, one row of bits per component.
+        Components are handled from the highest id down, so the rows of every reachable component are complete
+        by the time they are merged into the row of the component reaching them.
+        """
+        offsets = self.__offsets
+        targets = self.__targets
+
+        # Python integers work as bit sets, merged by a bitwise or in C
+        rows: List[int] = [0] * count
+        for component in range(count - 1, -1, -1):
+            row = 1 << component
+            for position in range(offsets[component], offsets[component + 1]):
+                row |= rows[targets[position]]
+            rows[component] = row
+
+        self.__row_size = (count + 7) // 8
+        self.__closure = bytearray().join(row.to_bytes(self.__row_size, 'little') for row in rows)
+
+    def __build_labels(self, count: int):
+        """
+        Builds the interval labels of a depth-first spanning forest, and the highest reachable component ids.
+        """
+        offsets = self.__offsets
+        targets = self.__targets
+
+        low = array('i', [0]) * count
+        post = array('i', [-1]) * count
+        counter = 0
+
+        for root in range(count):
+            if post[root] != -1:
+                continue
+
+            # Mark the root as discovered, while its post-order number is not yet known
+            post[root] = -2
+            path = [(root, offsets[root])]
+            low[root] = counter
+
+            while len(path) > 0:
+                node, position = path[-1]
+
+                if position < offsets[node + 1]:
+                    path[-1] = (node, position + 1)
+                    adjacent = targets[position]
+
+                    if post[adjacent] == -1:
+                        post[adjacent] = -2
+                        low[adjacent] = counter
+                        path.append((adjacent, offsets[adjacent]))
+                    continue
+
+                path.pop()
+                post[node] = counter
+                counter += 1
+
+        highest = array('i', range(count))
+        for component in range(count - 1, -1, -1):
+            for position in range(offsets[component], offsets[component + 1]):
+                if highest[targets[position]] > highest[component]:
+                    highest[component] = highest[targets[position]]
+
+        self.__low = low
+        self.__post = post
+        self.__highest = highest
+
+    def __reaches(self, source: int, target: int) -> bool:
+        """
+        The implementation detail of a query on a graph too large for the transitive closure.
+        :param source: is the component of the first node.
+        :param target: is the component of the second node.
+        :return: a boolean value determining if the source component reaches the target component.
+        """
+        low = self.__low
+        post = self.__post
+        highest = self.__highest
+
+        def contains(component: int) -> bool:
+            return low[component] <= post[target] <= post[component]
+
+        if source == target or contains(source):
+            return True
+
+        if target < source or target > highest[source]:
+            return False
+
+        offsets = self.__offsets
+        targets = self.__targets
+
+        visited = {source}
+        stack = [source]
+
+        while len(stack) > 0:
+            current = stack.pop()
+
+            for position in range(offsets[current], offsets[current + 1]):
+                adjacent = targets[position]
+
+                if adjacent in visited or adjacent > target or highest[adjacent] < target:
+                    continue
+
+                if adjacent == target or contains(adjacent):
+                    return True
+
+                visited.add(adjacent)
+                stack.append(adjacent)
+
+        return False
@@ -1,15 +1,29 @@
 import heapq
-from typing import Dict, List, Set
-import random
+import itertools
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
+from array import array
 
 from graphs.Path import Path
+from graphs.disjoint_set import DisjointSet
+from graphs.edge_list import read_csv
+from graphs.frozen_graph import FrozenGraph
+from graphs.operation_stats import StatsRecorder
+from graphs.parallel import all_pairs_shortest_paths
 
 
 class _Node:
+    __slots__ = ('__label', '__position', '__index')
     __label: str
+    __position: Tuple[float, ...] or None
+    __index: int
 
-    def __init__(self, label: str):
+    def __init__(self, label: str, position: Tuple[float, ...] or None = None, index: int = 0):
         self.__label = label
+        self.__position = position
+        self.__index = index
 
     def __str__(self):
         return self.__label
@@ -18,8 +32,17 @@ class _Node:
     def label(self):
         return self.__label
 
+    @property
+    def position(self):
+        return self.__position
+
+    @property
+    def index(self):
+        return self.__index
+
 
 class _NodeEntry:
+    __slots__ = ('__node', '__priority')
     __node: _Node
     __priority: float
 
@@ -37,6 +60,7 @@ class _NodeEntry:
 
 
 class _Edge:
+    __slots__ = ('__source', '__target', '_weight')
     __source: _Node
     __target: _Node
     _weight: int
@@ -63,29 +87,77 @@ class _Edge:
 
 
 # Note that this graph is an undirected, weighted graph.
-class WeightedGraph:
+class WeightedGraph(StatsRecorder):
+    __slots__ = ('__nodes', '__adjacency_list', '__path_cache', '__path_cache_size', '__path_cache_capacity',
+                 '__components', '__negative_edge_count')
+
     # Holds key: label, value: _Node object
-    __nodes: Dict[str, _Node] = {}
+    __nodes: Dict[str, _Node]
+
+    __adjacency_list: Dict[_Node, List[_Edge]]
+
+    # Holds key: source node, value: shortest-path tree from that source, as a previous node relationship.
+    # Ordered from least to most recently used.
+    __path_cache: 'OrderedDict[_Node, Dict[_Node, _Node]]'
+
+    # The amount of node entries held across all cached trees, and the most that may be held
+    __path_cache_size: int
+    __path_cache_capacity: int
+
+    # Holds the connected components, by node index, kept up to date as edges are added
+    __components: DisjointSet
 
-    __adjacency_list: Dict[_Node, List[_Edge]] = {}
+    # The amount of edges with a negative weight, which Dijkstra's algorithm cannot handle
+    __negative_edge_count: int
 
-    def add_node(self, label: str):
+    def __init__(self, path_cache_capacity: int = 1_000_000):
         """
-        Adds a node to the graph.
-        :param label: is the label of the node.
+        Creates an empty graph.
+        :param path_cache_capacity: is the maximum amount of node entries held across all cached
+        shortest-path trees. Each entry costs around 100 bytes. Use 0 to disable the cache.
         """
-        node = None
+        super().__init__()
+
+        # Each graph owns its containers, so separate instances, such as a graph and
+        # its minimum spanning tree, never share nodes or edges
+        self.__nodes = {}
+        self.__adjacency_list = {}
+        self.__path_cache = OrderedDict()
+        self.__path_cache_size = 0
+        self.__path_cache_capacity = path_cache_capacity
+        self.__components = DisjointSet()
+        self.__negative_edge_count = 0
 
-        if label not in self.__nodes:
-            node = _Node(label)
-            self.__nodes[label] = node
+    @property
+    def component_count(self) -> int:
+        """
+        Gets the amount of connected components in the graph. A node without edges is a component of its own.
+        """
+        return self.__components.count
+
+    @property
+    def has_negative_weights(self) -> bool:
+        """
+        Gets a boolean value determining if any edge has a negative weight.
+        Shortest paths are then calculated by the Bellman-Ford algorithm instead of Dijkstra's algorithm.
+        """
+        return self.__negative_edge_count > 0
 
+    def add_node(self, label: str, position: Tuple[float, ...] or None = None):
+        """
+        Adds a node to the graph.
+        :param label: is the label of the node.
+        :param position: are the coordinates of the node, such as (x, y), used by the default A* heuristic.
+        """
         # This means that the label is already in self.__nodes
-        if node is None:
+        if label in self.__nodes:
             return
 
-        if node not in self.__adjacency_list:
-            self.__adjacency_list[node] = []
+        node = _Node(label, position, self.__components.add())
+        self.__nodes[label] = node
+        self.__adjacency_list[node] = []
+
+        self.__clear_path_cache()
 
     def add_edge(self, first: str, second: str, weight: int = 0):
         """
@@ -105,14 +177,42 @@ class WeightedGraph:
         # Because this graph is undirected, the edge relationship must go both ways.
         self.__adjacency_list.get(first_node).append(_Edge(first_node, second_node, weight))
         self.__adjacency_list.get(second_node).append(_Edge(second_node, first_node, weight))
+        self.__components.union(first_node.index, second_node.index)
 
-    def get_shortest_path(self, source: str, target: str) -> Path:
+        if weight < 0:
+            self.__negative_edge_count += 1
+
+        # Cached shortest-path trees may no longer be the shortest
+        self.__clear_path_cache()
+
+    def get_shortest_path(self, source: str, target: str, method: str = "dijkstra",
+                          heuristic: Callable[[str, str], float] or None = None) -> Path:
         """
-        Calculates the shortest distance between two nodes using Dijkstra's algorithm.
+        Calculates the shortest path between two nodes.
+        The search stops as soon as the target node is settled, unless a cached shortest-path tree
+        from the source node already answers the query.
         :param source: is the label of the source node.
         :param target: is the label of the target node.
-        :return: the shortest distance between source and target node.
+        :param method: is one of
+            "dijkstra": Dijkstra's algorithm, exploring outwards from the source node.
+            "bidirectional": Dijkstra's algorithm from both ends at once, stopping once the searches meet.
+            "a_star": the A* algorithm, guided towards the target node by a heuristic.
+            "bellman_ford": the queue-based Bellman-Ford algorithm, which handles negative weights.
+        If any edge has a negative weight, "bellman_ford" is always used, as the other methods may return
+        a path that is not the shortest.
+        :param heuristic: is the A* heuristic, taking a node label and the target label and returning a lower
+        bound of the distance between them. It must never overestimate, or the path may not be the shortest.
+        Defaults to the straight-line distance between node positions, which requires every edge weight to be
+        at least the straight-line distance between its nodes.
+        :return: the shortest path between source and target node, or an empty path if target is unreachable.
+        :raise AttributeError: if a node does not exist, the method is unknown,
+        or a negative cycle is reachable from the source node.
         """
+        # Checked up front, so an unknown method fails even when a cached tree or negative weights decide the search
+        if method not in ("dijkstra", "bidirectional", "a_star", "bellman_ford"):
+            raise AttributeError(f'Unknown method "{method}". '
+                                 f'Expected "dijkstra", "bidirectional", "a_star" or "bellman_ford".')
+
         source_node = self.__nodes.get(source)
         if source_node is None:
             raise AttributeError("Source node does not exist.")
@@ -121,50 +221,625 @@ class WeightedGraph:
         if target_node is None:
             raise AttributeError("Target node does not exist.")
 
-        # Holds the shortest distance from start node to the current node
-        # Initially populate with each node and a distance of Infinity
-        distances: Dict[_Node, float] = dict(
-            (node, float('inf')) for node in self.__nodes.values()
-        )
-        # Set distance equals 0 to find the source node
-        distances[source_node] = 0
+        if source_node in self.__path_cache:
+            stats_enabled = self.stats_enabled
+            start = time.perf_counter() if stats_enabled else 0.0
+            path = self.__build_cached_path(source_node, target_node, self.__get_path_tree(source_node))
 
-        # Holds all visited nodes
-        visited: Set[_Node] = set()
+            if stats_enabled:
+                self._record("path_cache", start)
+
+            return path
+
+        if self.__negative_edge_count > 0 or method == "bellman_ford":
+            distances, previous_nodes = self.__bellman_ford(source_node)
+        elif method == "dijkstra":
+            distances, previous_nodes = self.__dijkstra(source_node, target_node)
+        elif method == "a_star":
+            distances, previous_nodes = self.__a_star(source_node, target_node, heuristic)
+        else:
+            return self.__bidirectional_dijkstra(source_node, target_node)
+
+        if target_node not in distances:
+            return Path()
+
+        return self.__build_path(target_node, previous_nodes)
+
+    def get_shortest_paths(self, pairs: Iterable[Tuple[str, str]]) -> List[Path]:
+        """
+        Calculates the shortest paths between many pairs of nodes.
+        The pairs are grouped by source node, so Dijkstra's algorithm runs at most once per distinct source.
+        The resulting shortest-path trees are kept in a least-recently-used cache, bounded by the path
+        cache capacity, so later batches and calls to get_shortest_path can reuse them.
+        Any change to the graph clears the cache.
+        :param pairs: are the (source label, target label) pairs.
+        :return: the shortest path of each pair, in the same order as the pairs.
+        :raise AttributeError: if a node does not exist, or a negative cycle is reachable from a source node.
+        """
+        # Holds key: source node, value: the positions and target nodes of the pairs from that source
+        groups: Dict[_Node, List[Tuple[int, _Node]]] = {}
+        count = 0
+
+        for source, target in pairs:
+            source_node = self.__nodes.get(source)
+            if source_node is None:
+                raise AttributeError("Source node does not exist.")
 
-        # Holds the relationship between the current node and its previous node with shortest distance
-        # Initially populate with each node and previous node = None
-        previous_nodes: Dict[_Node, _Node or None] = {}
+            target_node = self.__nodes.get(target)
+            if target_node is None:
+                raise AttributeError("Target node does not exist.")
 
-        priority_queue = []
-        heapq.heapify(priority_queue)
+            groups.setdefault(source_node, []).append((count, target_node))
+            count += 1
 
-        priority_queue.append((distances[source_node], source_node))
-        heapq.heapify(priority_queue)
+        paths: List[Path or None] = [None] * count
+
+        for source_node, targets in groups.items():
+            previous_nodes = self.__get_path_tree(source_node)
+
+            for position, target_node in targets:
+                paths[position] = self.__build_cached_path(source_node, target_node, previous_nodes)
+
+        return paths
+
+    def __get_path_tree(self, source_node: _Node) -> Dict[_Node, _Node]:
+        """
+        Gets the full shortest-path tree from a source node, from the cache if possible.
+        :param source_node: is the source node.
+        :return: the previous node relationship of every node reachable from the source node.
+        """
+        previous_nodes = self.__path_cache.get(source_node)
+
+        if previous_nodes is not None:
+            # Mark the tree as the most recently used
+            self.__path_cache.move_to_end(source_node)
+            return previous_nodes
+
+        _, previous_nodes = self.__single_source(source_node)
+        size = self.__get_path_tree_size(previous_nodes)
+
+        # A tree larger than the whole cache is used once and never stored, which is every tree at capacity 0
+        if size > self.__path_cache_capacity:
+            return previous_nodes
+
+        # Evict the least recently used trees until the new tree fits
+        while self.__path_cache_size + size > self.__path_cache_capacity:
+            _, evicted = self.__path_cache.popitem(last=False)
+            self.__path_cache_size -= self.__get_path_tree_size(evicted)
+
+        self.__path_cache[source_node] = previous_nodes
+        self.__path_cache_size += size
+
+        return previous_nodes
+
+    @staticmethod
+    def __get_path_tree_size(previous_nodes: Dict[_Node, _Node]) -> int:
+        """
+        Gets the amount of entries a shortest-path tree counts for in the path cache.
+        A source without edges has an empty tree, which still counts as one, so the amount of trees stays bounded.
+        :param previous_nodes: is the previous node relationship of the tree.
+        :return: the amount of entries.
+        """
+        return max(len(previous_nodes), 1)
+
+    def __clear_path_cache(self):
+        if len(self.__path_cache) > 0:
+            self.__path_cache.clear()
+            self.__path_cache_size = 0
+
+    def __build_cached_path(self, source_node: _Node, target_node: _Node, previous_nodes: Dict[_Node, _Node]) -> Path:
+        # Only the source node itself is reachable without a previous node
+        if target_node is not source_node and target_node not in previous_nodes:
+            return Path()
+
+        return self.__build_path(target_node, previous_nodes)
+
+    def get_shortest_distances(self, source: str) -> Dict[str, float]:
+        """
+        Calculates the shortest distance from a source node to every node reachable from it,
+        using a single run of Dijkstra's algorithm, or of the Bellman-Ford algorithm if any weight is negative.
+        :param source: is the label of the source node.
+        :return: a dictionary with key: label, value: shortest distance from the source node.
+        :raise AttributeError: if the node does not exist, or a negative cycle is reachable from it.
+        """
+        source_node = self.__nodes.get(source)
+        if source_node is None:
+            raise AttributeError("Source node does not exist.")
+
+        distances, _ = self.__single_source(source_node)
+
+        return dict((node.label, distance) for node, distance in distances.items())
+
+    def all_pairs_shortest_paths(self, sources: Iterable[str] or None = None,
+                                 workers: int or None = None) -> Iterator[Tuple[str, Dict[str, float]]]:
+        """
+        Calculates the shortest distances from many source nodes in parallel, using a pool of worker processes.
+        The graph is frozen and placed in shared memory once, instead of being pickled for every source.
+        Results are yielded as soon as each source is finished, so they do not arrive in the order of the sources.
+        :param sources: are the labels of the source nodes. Defaults to every node, giving all pairs.
+        :param workers: is the amount of worker processes. Defaults to the amount of CPUs.
+        :return: a generator of (source label, dictionary with key: label, value: shortest distance) pairs,
+        holding only the reachable nodes.
+        :raise AttributeError: if any edge has a negative weight, as the workers run Dijkstra's algorithm.
+        """
+        if self.__negative_edge_count > 0:
+            raise AttributeError("Parallel shortest paths require non-negative weights.")
+
+        return all_pairs_shortest_paths(self.freeze(), sources, workers)
+
+    def get_k_shortest_paths(self, source: str, target: str, k: int or None = None) -> Iterator[Path]:
+        """
+        Lazily enumerates the shortest loopless paths between two nodes in increasing order of cost,
+        using Yen's algorithm. Each path after the first is a detour from a previous one: it follows a previous
+        path up to some spur node, and then takes the shortest route to the target that does not branch off
+        the same way as any path found so far.
+        The candidate detours are kept in a heap between yields, and the detours of a path are only searched for
+        once the next path is asked for, so taking the first few paths costs only the work for those paths.
+        Detours are only searched for from the point where a path left the path it is a detour of, because the
+        detours from earlier nodes were already searched for from that path.
+        :param source: is the label of the source node.
+        :param target: is the label of the target node.
+        :param k: is the maximum amount of paths. Defaults to every loopless path.
+        :return: a generator of paths, from the shortest to the longest. Paths of equal cost may come in any order.
+        :raise AttributeError: if a node does not exist, or any edge has a negative weight.
+        """
+        source_node = self.__nodes.get(source)
+        if source_node is None:
+            raise AttributeError("Source node does not exist.")
+
+        target_node = self.__nodes.get(target)
+        if target_node is None:
+            raise AttributeError("Target node does not exist.")
+
+        if self.__negative_edge_count > 0:
+            raise AttributeError("K shortest paths require non-negative weights.")
+
+        return self.__yen(source_node, target_node, k)
+
+    def __yen(self, source_node: _Node, target_node: _Node, k: int or None) -> Iterator[Path]:
+        """
+        The implementation detail of Yen's algorithm. Paths are held as a list of nodes, a list of the distance
+        from the source node to each of them, and the position of the spur node they were found from.
+        """
+        found = self.__restricted_dijkstra(source_node, target_node, set(), set())
+        if found is None:
+            return
+
+        # Holds key: a path prefix found so far, value: the nodes that paths found so far continue it with
+        branches: Dict[Tuple[_Node, ...], Set[_Node]] = {}
+
+        # Holds the candidate paths as (cost, counter, nodes, distances, spur position), and the nodes of every path
+        # ever pushed, so the same detour found from separate paths is only held once
+        counter = itertools.count()
+        candidates: List[Tuple[float, int, List[_Node], List[float], int]] = []
+        seen: Set[Tuple[_Node, ...]] = {tuple(found[0])}
+
+        spur_position = 0
+        count = 0
+
+        while k is None or count < k:
+            nodes, distances = found
+
+            for i in range(len(nodes) - 1):
+                branches.setdefault(tuple(nodes[:i + 1]), set()).add(nodes[i + 1])
+
+            path = Path()
+            for node in nodes:
+                path.add(node.label)
+
+            yield path
+            count += 1
+
+            if k is not None and count >= k:
+                return
+
+            # Search the detours of the path just yielded, from each of its nodes but the target
+            for i in range(spur_position, len(nodes) - 1):
+                spur_node = nodes[i]
+                root = tuple(nodes[:i + 1])
+
+                # The detour may neither branch off the way a path found so far does,
+                # nor pass through the root path again, which would make a loop
+                spur = self.__restricted_dijkstra(spur_node, target_node, set(nodes[:i]),
+                                                  set((spur_node, next_node) for next_node in branches[root]))
+                if spur is None:
+                    continue
+
+                spur_nodes, spur_distances = spur
+                candidate_nodes = nodes[:i] + spur_nodes
+
+                key = tuple(candidate_nodes)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                candidate_distances = distances[:i] + [distances[i] + distance for distance in spur_distances]
+                heapq.heappush(candidates, (candidate_distances[-1], next(counter), candidate_nodes,
+                                            candidate_distances, i))
+
+            if len(candidates) == 0:
+                return
+
+            _, _, candidate_nodes, candidate_distances, spur_position = heapq.heappop(candidates)
+            found = (candidate_nodes, candidate_distances)
+
+    def __restricted_dijkstra(self, source_node: _Node, target_node: _Node, excluded_nodes: Set[_Node],
+                              excluded_edges: Set[Tuple[_Node, _Node]]) -> Tuple[List[_Node], List[float]] or None:
+        """
+        Dijkstra's algorithm on the graph without some of its nodes and edges.
+        :param source_node: is the source node.
+        :param target_node: is the target node.
+        :param excluded_nodes: are the nodes to leave out.
+        :param excluded_edges: are the (source node, target node) pairs of the edges to leave out.
+        :return: the nodes of the shortest path and the distance from the source node to each of them,
+        or None if the target node is unreachable.
+        """
+        distances: Dict[_Node, float] = {source_node: 0}
+        previous_nodes: Dict[_Node, _Node] = {}
+        settled: Set[_Node] = set()
+
+        counter = itertools.count()
+        priority_queue = [(0, next(counter), source_node)]
 
         while len(priority_queue) > 0:
-            current: _Node = priority_queue.pop()[1]
-            visited.add(current)
+            distance, _, current = heapq.heappop(priority_queue)
+
+            if current in settled:
+                continue
+
+            settled.add(current)
+
+            if current is target_node:
+                nodes = [current]
+                while current is not source_node:
+                    current = previous_nodes[current]
+                    nodes.append(current)
+                nodes.reverse()
+
+                return nodes, [distances[node] for node in nodes]
 
-            # Visit unvisited neighbors
             for edge in self.__adjacency_list[current]:
-                if edge.target in visited:
+                next_node = edge.target
+                if next_node in settled or next_node in excluded_nodes or (current, next_node) in excluded_edges:
+                    continue
+
+                next_distance = distance + edge.weight
+                if next_distance < distances.get(next_node, float('inf')):
+                    distances[next_node] = next_distance
+                    previous_nodes[next_node] = current
+                    heapq.heappush(priority_queue, (next_distance, next(counter), next_node))
+
+        return None
+
+    def __single_source(self, source_node: _Node) -> Tuple[Dict[_Node, float], Dict[_Node, _Node]]:
+        """
+        Calculates the full shortest-path tree from a source node, with the algorithm suited to the weights.
+        :param source_node: is the source node.
+        :return: the shortest distances and the previous node on the shortest path, for each reachable node.
+        """
+        if self.__negative_edge_count > 0:
+            return self.__bellman_ford(source_node)
+
+        return self.__dijkstra(source_node, None)
+
+    def __bellman_ford(self, source_node: _Node) -> Tuple[Dict[_Node, float], Dict[_Node, _Node]]:
+        """
+        The implementation detail of the queue-based Bellman-Ford algorithm, also known as SPFA.
+        Instead of relaxing every edge V - 1 times, only the edges of nodes whose distance just decreased
+        are relaxed again, which is O(V * E) at worst but usually close to O(E).
+        A shortest path never repeats a node, so it has fewer than V edges. If a path with V edges is found,
+        it must go around a cycle whose total weight is negative, and there is no shortest path.
+        Because this graph is undirected, a single negative edge is already such a cycle, going back and forth.
+        :param source_node: is the source node.
+        :return: the shortest distances and the previous node on the shortest path, for each reachable node.
+        :raise AttributeError: if a negative cycle is reachable from the source node.
+        """
+        distances: Dict[_Node, float] = {source_node: 0}
+        previous_nodes: Dict[_Node, _Node] = {}
+
+        # Holds the amount of edges on the shortest path found so far to each node
+        lengths: Dict[_Node, int] = {source_node: 0}
+
+        stats_enabled = self.stats_enabled
+        start = time.perf_counter() if stats_enabled else 0.0
+
+        node_count = len(self.__nodes)
+        queue = deque([source_node])
+        queued: Set[_Node] = {source_node}
+
+        # Counters are updated once per node taken from the queue, never per edge, and only while recording
+        settled_count = 0
+        pushes = 1
+        relaxed = 0
+        peak = 1
+
+        while len(queue) > 0:
+            current = queue.popleft()
+            queued.discard(current)
+
+            if stats_enabled:
+                settled_count += 1
+
+            distance = distances[current]
+            length = lengths[current] + 1
+
+            connections = self.__adjacency_list[current]
+            if stats_enabled:
+                relaxed += len(connections)
+
+            for edge in connections:
+                next_node = edge.target
+                next_distance = distance + edge.weight
+
+                if next_distance < distances.get(next_node, float('inf')):
+                    if length >= node_count:
+                        raise AttributeError(f'Negative cycle through node {next_node} is reachable from the source.')
+
+                    distances[next_node] = next_distance
+                    previous_nodes[next_node] = current
+                    lengths[next_node] = length
+
+                    if next_node not in queued:
+                        queued.add(next_node)
+                        queue.append(next_node)
+
+                        if stats_enabled:
+                            pushes += 1
+
+            if stats_enabled and len(queue) > peak:
+                peak = len(queue)
+
+        if stats_enabled:
+            self._record("bellman_ford", start, settled_count, relaxed, pushes, settled_count, peak)
+
+        return distances, previous_nodes
+
+    def __dijkstra(self, source_node: _Node, target_node: _Node or None) -> \
+            Tuple[Dict[_Node, float], Dict[_Node, _Node]]:
+        """
+        The implementation detail of Dijkstra's algorithm, using a binary heap with lazy deletion.
+        Instead of decreasing the priority of a node already in the heap, we push a new entry and
+        skip outdated entries when they are popped. Every push and pop is therefore O(log V).
+        :param source_node: is the source node.
+        :param target_node: is the node to stop at once settled, or None to settle every reachable node.
+        :return: the shortest distances and the previous node on the shortest path, for each reached node.
+        """
+        # Holds the shortest distance found so far from the source node to each reached node
+        distances: Dict[_Node, float] = {source_node: 0}
+
+        # Holds the relationship between a node and its previous node on the shortest path
+        previous_nodes: Dict[_Node, _Node] = {}
+
+        # Holds the nodes whose shortest distance is final
+        settled: Set[_Node] = set()
+
+        stats_enabled = self.stats_enabled
+        start = time.perf_counter() if stats_enabled else 0.0
+
+        # The counter breaks ties between equal distances, so nodes themselves are never compared.
+        # It also counts the heap pushes, from which the pops follow, so only the edges relaxed and
+        # the peak heap size are counted separately, once per settled node and only while recording.
+        counter = itertools.count()
+        priority_queue = [(0, next(counter), source_node)]
+        relaxed = 0
+        peak = 1
+
+        while len(priority_queue) > 0:
+            distance, _, current = heapq.heappop(priority_queue)
+
+            # Outdated entry; a shorter distance to this node has already been settled
+            if current in settled:
+                continue
+
+            settled.add(current)
+
+            # The target node's distance is final, so there is no need to explore further
+            if current is target_node:
+                break
+
+            connections = self.__adjacency_list[current]
+            if stats_enabled:
+                relaxed += len(connections)
+
+            for edge in connections:
+                next_node = edge.target
+                if next_node in settled:
                     continue
 
-                # Calculate distance to unvisited neighbor based on source node and current node
-                distance = distances[current] + edge.weight
+                # Calculate distance to unsettled neighbor through the current node
+                next_distance = distance + edge.weight
 
                 # New distance is smaller than previous distance
-                if distance < distances[edge.target]:
-                    distances[edge.target] = distance
+                if next_distance < distances.get(next_node, float('inf')):
+                    distances[next_node] = next_distance
+                    previous_nodes[next_node] = current
+                    heapq.heappush(priority_queue, (next_distance, next(counter), next_node))
 
-                    # Set next node's previous node to be the current node
-                    previous_nodes[edge.target] = current
+            if stats_enabled and len(priority_queue) > peak:
+                peak = len(priority_queue)
 
-                    priority_queue.append((distance, edge.target))
-                    heapq.heapify(priority_queue)
+        if stats_enabled:
+            pushes = next(counter)
+            self._record("dijkstra", start, len(settled), relaxed, pushes, pushes - len(priority_queue), peak)
 
-        return self.__build_path(target_node, previous_nodes)
+        return distances, previous_nodes
+
+    def __a_star(self, source_node: _Node, target_node: _Node,
+                 heuristic: Callable[[str, str], float] or None) -> Tuple[Dict[_Node, float], Dict[_Node, _Node]]:
+        """
+        The implementation detail of the A* algorithm.
+        This is Dijkstra's algorithm, except that the heap is ordered by the distance from the source node
+        plus the heuristic estimate of the remaining distance, so nodes in the direction of the target are
+        settled first. A node may be settled again if a shorter distance to it is found later,
+        which keeps the result correct for heuristics that are admissible but not consistent.
+        :param source_node: is the source node.
+        :param target_node: is the target node.
+        :param heuristic: is the heuristic, or None to use the straight-line distance between node positions.
+        :return: the shortest distances and the previous node on the shortest path, for each reached node.
+        """
+        if heuristic is None:
+            target_position = target_node.position
+            if target_position is None:
+                raise AttributeError("Target node has no position for the default A* heuristic.")
+
+            def estimate(node: _Node) -> float:
+                if node.position is None:
+                    raise AttributeError(f'Node {node} has no position for the default A* heuristic.')
+                return math.dist(node.position, target_position)
+        else:
+            target_label = target_node.label
+
+            def estimate(node: _Node) -> float:
+                return heuristic(node.label, target_label)
+
+        distances: Dict[_Node, float] = {source_node: 0}
+        previous_nodes: Dict[_Node, _Node] = {}
+
+        # Holds the heuristic estimate of each reached node, so it is calculated only once per node
+        estimates: Dict[_Node, float] = {source_node: estimate(source_node)}
+
+        stats_enabled = self.stats_enabled
+        start = time.perf_counter() if stats_enabled else 0.0
+
+        settled_count = 0
+        relaxed = 0
+        peak = 1
+
+        counter = itertools.count()
+        priority_queue = [(estimates[source_node], next(counter), 0, source_node)]
+
+        while len(priority_queue) > 0:
+            _, _, distance, current = heapq.heappop(priority_queue)
+
+            # Outdated entry; a shorter distance to this node has been found since it was pushed
+            if distance > distances[current]:
+                continue
+
+            if stats_enabled:
+                settled_count += 1
+
+            if current is target_node:
+                break
+
+            connections = self.__adjacency_list[current]
+            if stats_enabled:
+                relaxed += len(connections)
+
+            for edge in connections:
+                next_node = edge.target
+                next_distance = distance + edge.weight
+
+                if next_distance < distances.get(next_node, float('inf')):
+                    distances[next_node] = next_distance
+                    previous_nodes[next_node] = current
+
+                    if next_node not in estimates:
+                        estimates[next_node] = estimate(next_node)
+
+                    heapq.heappush(priority_queue,
+                                   (next_distance + estimates[next_node], next(counter), next_distance, next_node))
+
+            if stats_enabled and len(priority_queue) > peak:
+                peak = len(priority_queue)
+
+        if stats_enabled:
+            pushes = next(counter)
+            self._record("a_star", start, settled_count, relaxed, pushes, pushes - len(priority_queue), peak)
+
+        return distances, previous_nodes
+
+    def __bidirectional_dijkstra(self, source_node: _Node, target_node: _Node) -> Path:
+        """
+        The implementation detail of bidirectional Dijkstra's algorithm.
+        One search runs forwards from the source node and one backwards from the target node, taking turns
+        with whichever has the smaller heap top. Every node reached by both searches gives a candidate path
+        through it. Once the two heap tops add up to at least the best candidate,
+        no shorter path can exist, which usually happens long before either search has covered
+        the area a single search would need.
+        :param source_node: is the source node.
+        :param target_node: is the target node.
+        :return: the shortest path between source and target node, or an empty path if target is unreachable.
+        """
+        stats_enabled = self.stats_enabled
+        start = time.perf_counter() if stats_enabled else 0.0
+
+        if source_node is target_node:
+            if stats_enabled:
+                self._record("bidirectional", start, 1)
+            return self.__build_path(target_node, {})
+
+        # Index 0 holds the forward search, and index 1 the backward search
+        distances: List[Dict[_Node, float]] = [{source_node: 0}, {target_node: 0}]
+        previous_nodes: List[Dict[_Node, _Node]] = [{}, {}]
+        settled: List[Set[_Node]] = [set(), set()]
+
+        counter = itertools.count()
+        queues = [[(0, next(counter), source_node)], [(0, next(counter), target_node)]]
+
+        # The length of the shortest path found so far, and the node where its two halves meet
+        best = float('inf')
+        meeting_node: _Node or None = None
+
+        relaxed = 0
+        peak = 2
+
+        while len(queues[0]) > 0 and len(queues[1]) > 0:
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            other = 1 - side
+
+            distance, _, current = heapq.heappop(queues[side])
+            if current in settled[side]:
+                continue
+
+            settled[side].add(current)
+
+            connections = self.__adjacency_list[current]
+            if stats_enabled:
+                relaxed += len(connections)
+
+            for edge in connections:
+                next_node = edge.target
+                if next_node in settled[side]:
+                    continue
+
+                next_distance = distance + edge.weight
+
+                if next_distance < distances[side].get(next_node, float('inf')):
+                    distances[side][next_node] = next_distance
+                    previous_nodes[side][next_node] = current
+                    heapq.heappush(queues[side], (next_distance, next(counter), next_node))
+
+                # The other search has reached the adjacent node, so the two halves form a path through it
+                if next_node in distances[other]:
+                    length = distances[side][next_node] + distances[other][next_node]
+                    if length < best:
+                        best = length
+                        meeting_node = next_node
+
+            if stats_enabled and len(queues[0]) + len(queues[1]) > peak:
+                peak = len(queues[0]) + len(queues[1])
+
+        if stats_enabled:
+            pushes = next(counter)
+            self._record("bidirectional", start, len(settled[0]) + len(settled[1]), relaxed, pushes,
+                          pushes - len(queues[0]) - len(queues[1]), peak)
+
+        if meeting_node is None:
+            return Path()
+
+        # The forward half is built from the previous nodes, ending at the meeting node
+        path = self.__build_path(meeting_node, previous_nodes[0])
+
+        # The backward half follows the previous nodes of the backward search towards the target node
+        current = previous_nodes[1].get(meeting_node)
+        while current is not None:
+            path.add(current.label)
+            current = previous_nodes[1].get(current)
+
+        return path
 
     def __build_path(self, target_node: _Node, previous_nodes: Dict[_Node, _Node]) -> Path:
         # Initially populate the stack with the target node
@@ -181,77 +856,348 @@ class WeightedGraph:
 
         return path
 
-    def has_cycle(self) -> bool:
-        visited: Set[_Node] = set()
+    def connected(self, first: str, second: str) -> bool:
+        """
+        Checks if there is a path between two nodes.
+        The connected components are kept up to date as edges are added, so this does not traverse the graph,
+        and runs in near-constant time.
+        :param first: is the label of the first node.
+        :param second: is the label of the second node.
+        :return: a boolean value determining if the nodes are connected.
+        :raise AttributeError: if a node does not exist.
+        """
+        first_node = self.__nodes.get(first)
+        if first_node is None:
+            raise AttributeError("First node does not exist.")
+
+        second_node = self.__nodes.get(second)
+        if second_node is None:
+            raise AttributeError("Second node does not exist.")
+
+        return self.__components.connected(first_node.index, second_node.index)
+
+    def connected_components(self) -> List[List[str]]:
+        """
+        Groups the nodes of the graph by connected component, in O(V) without traversing the edges.
+        :return: the labels of the nodes of each component. Components are ordered by their first added node,
+        and the nodes within a component by the order in which they were added.
+        """
+        groups: Dict[int, List[str]] = {}
         for node in self.__nodes.values():
-            if (node not in visited) and (self.__has_cycle(visited, None, node)):
-                return True
-        return False
+            root = self.__components.find(node.index)
+            group = groups.get(root)
+            if group is None:
+                groups[root] = [node.label]
+            else:
+                group.append(node.label)
 
-    def __has_cycle(self, visited: Set[_Node], previous: _Node or None, node: _Node) -> bool:
-        visited.add(node)
+        return list(groups.values())
+
+    def has_cycle(self) -> bool:
+        """
+        Checks if the graph has a cycle, by a depth-first search for an edge to an already visited node,
+        other than the one we came from. This uses a stack instead of recursion, so it works on deep graphs.
+        :return: a boolean value determining if the graph is cyclic.
+        """
+        visited: Set[_Node] = set()
 
-        connections = self.__adjacency_list.get(node)
-        for edge in connections:
-            # In this case, this target node is the one we came from
-            if edge.target == previous:
+        for root in self.__nodes.values():
+            if root in visited:
                 continue
 
-            if edge.target in visited:
-                return True
+            visited.add(root)
+
+            # Holds (node, previous node) pairs
+            stack: List[Tuple[_Node, _Node or None]] = [(root, None)]
+
+            while len(stack) > 0:
+                node, previous = stack.pop()
+
+                for edge in self.__adjacency_list[node]:
+                    # In this case, this target node is the one we came from
+                    if edge.target is previous:
+                        continue
+
+                    if edge.target in visited:
+                        return True
 
-            # Pass current node as previous to detect potential cycle
-            if self.__has_cycle(visited, node, edge.target):
-                return True
+                    visited.add(edge.target)
+                    stack.append((edge.target, node))
 
         # In this case, we did not find a cycle
         return False
 
-    def get_minimum_spanning_tree(self):
-        tree: WeightedGraph = WeightedGraph()
+    def get_minimum_spanning_tree(self, method: str or None = None):
+        """
+        Calculates a minimum spanning tree of the graph.
+        If the graph is disconnected, this is a minimum spanning forest: one tree per connected component,
+        which together hold every node of the graph.
+        :param method: is either "prim" or "kruskal". Defaults to picking the faster one for the graph:
+        Kruskal, O(E log E), for sparse graphs, and Prim, O(V^2), for dense graphs.
+        :return: a new graph holding the tree.
+        :raise AttributeError: if the method is unknown.
+        """
+        if method is None:
+            edge_count = sum(len(connections) for connections in self.__adjacency_list.values()) // 2
+            node_count = len(self.__nodes)
+
+            # Prim's scans over the weight array run at C speed, so it already wins
+            # once the graph holds around 5% of all possible edges
+            method = "prim" if edge_count * 20 > node_count * node_count else "kruskal"
 
-        edges = []
-        heapq.heapify(edges)
+        if method == "prim":
+            return self.__prim()
 
-        if len(self.__nodes) == 0:
-            return tree
+        if method == "kruskal":
+            return self.__kruskal()
 
-        start_node: _Node = random.choice(list(self.__nodes.values()))
-        current_connections = self.__adjacency_list.get(start_node)
-        for edge in current_connections:
-            edges.append((edge.weight, edge))
-            heapq.heapify(edges)
+        raise AttributeError(f'Unknown method "{method}". Expected "prim" or "kruskal".')
 
-        tree.add_node(start_node.label)
+    def __prim(self):
+        """
+        The implementation detail of Prim's algorithm, in its array-based form for dense graphs.
+        The tree grows from a start node by repeatedly adding the node outside of it with the cheapest edge into it.
+        Instead of a heap holding up to one entry per edge, an array holds the cheapest known edge weight of
+        each node, and the next node is found by scanning that array. This costs O(V^2) in total, which is
+        as good as it gets when E is close to V^2. Once a component is exhausted, the tree grows again from
+        the next node outside of it.
+        """
+        stats_enabled = self.stats_enabled
+        start = time.perf_counter() if stats_enabled else 0.0
+
+        tree: WeightedGraph = WeightedGraph()
+
+        nodes: List[_Node] = list(self.__nodes.values())
+        ids: Dict[_Node, int] = dict((node, index) for index, node in enumerate(nodes))
 
-        if len(edges) == 0:
-            return tree
+        infinity = float('inf')
+        relaxed = 0
 
-        # As long as our tree doesn't contains all nodes in the graph
-        while len(tree.__nodes) < len(self.__nodes):
-            # Pick edge with minimum weight from the queue
-            minimum_edge = edges.pop()
-            next_node = minimum_edge.target
+        # Holds the weight of the cheapest edge from the tree to each node, and the edge itself
+        weights: List[float] = [infinity] * len(nodes)
+        cheapest: List[_Edge or None] = [None] * len(nodes)
+        in_tree = bytearray(len(nodes))
 
-            # Continue if the edge is currently connected to a node that exists in the tree
-            # in order to prevent a cyclic graph
-            if next_node in tree:
+        for start_node in nodes:
+            start_id = ids[start_node]
+            if in_tree[start_id]:
                 continue
 
-            # Add target node and edge to the tree
-            tree.add_node(next_node.label)
-            tree.add_edge(minimum_edge.source.label, next_node.label, minimum_edge.weight)
+            weights[start_id] = 0
+
+            while True:
+                minimum = min(weights)
+
+                # Every node reachable from the start node is in the tree
+                if minimum == infinity:
+                    break
+
+                current_id = weights.index(minimum)
+                current = nodes[current_id]
+
+                # Nodes in the tree are never picked again
+                in_tree[current_id] = 1
+                weights[current_id] = infinity
 
-            # Add all edges connected to the target node to the priority queue.
-            # We are only interested in the edges that connect to an unvisited node.
-            next_connections = self.__adjacency_list[next_node]
-            for edge in next_connections:
-                if edge.target not in tree:
-                    edges.append((edge.weight, edge))
-                    heapq.heapify(edges)
+                tree.add_node(current.label)
+                if cheapest[current_id] is not None:
+                    edge = cheapest[current_id]
+                    tree.add_edge(edge.source.label, current.label, edge.weight)
+
+                connections = self.__adjacency_list[current]
+                if stats_enabled:
+                    relaxed += len(connections)
+
+                for edge in connections:
+                    target_id = ids[edge.target]
+                    if not in_tree[target_id] and edge.weight < weights[target_id]:
+                        weights[target_id] = edge.weight
+                        cheapest[target_id] = edge
+
+        if stats_enabled:
+            self._record("prim", start, len(nodes), relaxed)
 
         return tree
 
+    def __kruskal(self):
+        """
+        The implementation detail of Kruskal's algorithm.
+        Edges are considered from cheapest to most expensive, and an edge is added to the tree unless
+        both of its nodes are already connected. A disjoint-set answers that in near-constant time.
+        """
+        stats_enabled = self.stats_enabled
+        start = time.perf_counter() if stats_enabled else 0.0
+
+        tree: WeightedGraph = WeightedGraph()
+
+        nodes: List[_Node] = list(self.__nodes.values())
+        ids: Dict[_Node, int] = dict((node, index) for index, node in enumerate(nodes))
+
+        for node in nodes:
+            tree.add_node(node.label)
+
+        # Each undirected edge is stored once in each direction, so only keep the direction
+        # going from a lower to a higher id. This also skips edges from a node to itself.
+        edges: List[Tuple[int, int, int]] = []
+        for node in nodes:
+            source_id = ids[node]
+            for edge in self.__adjacency_list[node]:
+                target_id = ids[edge.target]
+                if source_id < target_id:
+                    edges.append((edge.weight, source_id, target_id))
+
+        edges.sort()
+
+        components = DisjointSet(len(nodes))
+
+        # A spanning forest of V nodes has at most V - 1 edges
+        remaining = len(nodes) - 1
+        considered = 0
+
+        for weight, source_id, target_id in edges:
+            if remaining <= 0:
+                break
+
+            if stats_enabled:
+                considered += 1
+
+            if components.union(source_id, target_id):
+                tree.add_edge(nodes[source_id].label, nodes[target_id].label, weight)
+                remaining -= 1
+
+        if stats_enabled:
+            self._record("kruskal", start, len(nodes), considered)
+
+        return tree
+
+    @staticmethod
+    def from_edge_list(edges: Iterable[tuple]) -> 'WeightedGraph':
+        """
+        Builds a graph from a stream of edges in one pass, creating nodes as they first appear.
+        Nodes and edges are written straight into the containers of the new graph, whose path cache is still empty,
+        so the calls and checks of add_node and add_edge are skipped, and the cache is never cleared.
+        :param edges: are (first, second) or (first, second, weight) tuples. The weight defaults to 0.
+        :return: the new graph.
+        """
+        graph = WeightedGraph()
+
+        nodes = graph.__nodes
+        adjacency_list = graph.__adjacency_list
+        components = graph.__components
+
+        for edge in edges:
+            first_node = nodes.get(edge[0])
+            if first_node is None:
+                first_node = _Node(edge[0], None, components.add())
+                nodes[edge[0]] = first_node
+                adjacency_list[first_node] = []
+
+            second_node = nodes.get(edge[1])
+            if second_node is None:
+                second_node = _Node(edge[1], None, components.add())
+                nodes[edge[1]] = second_node
+                adjacency_list[second_node] = []
+
+            weight = edge[2] if len(edge) > 2 else 0
+            if weight < 0:
+                graph.__negative_edge_count += 1
+
+            adjacency_list[first_node].append(_Edge(first_node, second_node, weight))
+            adjacency_list[second_node].append(_Edge(second_node, first_node, weight))
+            components.union(first_node.index, second_node.index)
+
+        return graph
+
+    @staticmethod
+    def from_csv(path: str, delimiter: str = ',', has_header: bool = False) -> 'WeightedGraph':
+        """
+        Builds a graph from a CSV file holding one edge per row, streaming the file instead of reading it at once.
+        :param path: is the path of the file.
+        :param delimiter: is the column delimiter.
+        :param has_header: is a boolean value determining if the first row should be skipped.
+        :return: the new graph.
+        """
+        return WeightedGraph.from_edge_list(read_csv(path, delimiter, has_header))
+
+    def save(self, path: str):
+        """
+        Saves the graph to a binary snapshot file. See FrozenGraph.save for the format.
+        The snapshot only holds the labels, the edges and their weights, packed as floats. Node positions are not
+        saved, so a loaded graph needs an explicit heuristic for the "a_star" method of get_shortest_path.
+        :param path: is the path of the file to write.
+        """
+        self.freeze().save(path)
+
+    @staticmethod
+    def load(path: str) -> 'WeightedGraph':
+        """
+        Loads a graph from a binary snapshot file.
+        Use FrozenGraph.load instead for a memory-mapped graph, which loads in a fraction of the time.
+        As a snapshot holds no node positions and packs every weight as a float, the nodes of the loaded graph
+        have no position, and integer weights come back as floats, such as 3.0 for 3.
+        :param path: is the path of the file to read.
+        :return: the new graph.
+        """
+        frozen = FrozenGraph.load(path)
+
+        graph = WeightedGraph()
+        for label in frozen.labels:
+            graph.add_node(label)
+
+        nodes: List[_Node] = list(graph.__nodes.values())
+        offsets = frozen.offsets
+        targets = frozen.targets
+        weights = frozen.weights
+
+        for index, node in enumerate(nodes):
+            # An edge from a node to itself is stored twice in its own list, so only every second copy is added back
+            is_second_copy = False
+
+            for position in range(offsets[index], offsets[index + 1]):
+                target = targets[position]
+
+                # Each edge is stored once in each direction, and both directions are
+                # recreated from the direction going from a lower to a higher id
+                if index < target:
+                    adjacent_node = nodes[target]
+                    graph.__adjacency_list[node].append(_Edge(node, adjacent_node, weights[position]))
+                    graph.__adjacency_list[adjacent_node].append(_Edge(adjacent_node, node, weights[position]))
+                    graph.__components.union(index, target)
+                    if weights[position] < 0:
+                        graph.__negative_edge_count += 1
+                elif index == target:
+                    if is_second_copy:
+                        graph.__adjacency_list[node].append(_Edge(node, node, weights[position]))
+                        graph.__adjacency_list[node].append(_Edge(node, node, weights[position]))
+                        if weights[position] < 0:
+                            graph.__negative_edge_count += 1
+                    is_second_copy = not is_second_copy
+
+        return graph
+
+    def freeze(self) -> FrozenGraph:
+        """
+        Compiles the graph into an immutable, compact FrozenGraph.
+        Labels are packed into an integer id map, and the edges into flat target and weight buffers.
+        Because this graph is undirected, each edge is stored once in each direction.
+        Later changes to this graph are not reflected in the frozen graph.
+        :return: the frozen graph.
+        """
+        labels: List[str] = list(self.__nodes.keys())
+        ids: Dict[_Node, int] = dict((node, index) for index, node in enumerate(self.__nodes.values()))
+
+        offsets = array('i', [0])
+        targets = array('i')
+        weights = array('d')
+
+        for node in self.__nodes.values():
+            for edge in self.__adjacency_list[node]:
+                targets.append(ids[edge.target])
+                weights.append(edge.weight)
+            offsets.append(len(targets))
+
+        return FrozenGraph(labels, offsets, targets, weights, directed=False)
+
     def print(self):
         """
         Prints the nodes in the graph and their relationships.
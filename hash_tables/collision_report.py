@@ -0,0 +1,83 @@
+from typing import List
+
+
+class CollisionReport:
+    """
+    Describes how evenly the keys of a hash table are spread over its buckets.
+
+    A chain is the group of keys a lookup may have to step through: the keys of a bucket for a chained table,
+    or a run of occupied slots for an open addressing table. The probe length of a key is the amount of keys
+    a lookup of it compares against, including itself.
+    For a well spread table, the mean probe length stays close to 1 and the histogram falls off quickly.
+    """
+    __slots__ = ('__key_count', '__bucket_count', '__chain_lengths', '__probe_histogram')
+
+    __key_count: int
+    __bucket_count: int
+    __chain_lengths: List[int]
+    __probe_histogram: List[int]
+
+    def __init__(self, bucket_count: int, chain_lengths: List[int], probe_histogram: List[int]):
+        """
+        Creates a report.
+        :param bucket_count: is the amount of buckets or slots of the table.
+        :param chain_lengths: are the lengths of the non-empty chains.
+        :param probe_histogram: holds at index i the amount of keys with a probe length of i + 1.
+        """
+        self.__key_count = sum(probe_histogram)
+        self.__bucket_count = bucket_count
+        self.__chain_lengths = chain_lengths
+        self.__probe_histogram = probe_histogram
+
+    @property
+    def key_count(self) -> int:
+        return self.__key_count
+
+    @property
+    def bucket_count(self) -> int:
+        return self.__bucket_count
+
+    @property
+    def chain_count(self) -> int:
+        """
+        Gets the amount of non-empty chains.
+        """
+        return len(self.__chain_lengths)
+
+    @property
+    def max_chain_length(self) -> int:
+        return max(self.__chain_lengths, default=0)
+
+    @property
+    def mean_chain_length(self) -> float:
+        """
+        Gets the mean length of the non-empty chains.
+        """
+        return sum(self.__chain_lengths) / len(self.__chain_lengths) if len(self.__chain_lengths) > 0 else 0.0
+
+    @property
+    def probe_histogram(self) -> List[int]:
+        """
+        Gets the amount of keys with each probe length, where index i holds the keys with a probe length of i + 1.
+        """
+        return list(self.__probe_histogram)
+
+    @property
+    def mean_probe_length(self) -> float:
+        """
+        Gets the mean probe length of the keys, which is the mean cost of a successful lookup.
+        """
+        if self.__key_count == 0:
+            return 0.0
+
+        return sum((length + 1) * count for length, count in enumerate(self.__probe_histogram)) / self.__key_count
+
+    def __str__(self):
+        lines = [f'{self.__key_count} keys in {self.__bucket_count} buckets, {self.chain_count} chains, '
+                 f'max chain length {self.max_chain_length}, mean chain length {self.mean_chain_length:.2f}, '
+                 f'mean probe length {self.mean_probe_length:.2f}']
+
+        for length, count in enumerate(self.__probe_histogram):
+            lines.append(f'\tprobe length {length + 1}: {count}')
+
+        return '\n'.join(lines)
@@ -0,0 +1,40 @@
+from typing import Callable
+
+_MASK = (1 << 64) - 1
+
+_FNV_OFFSET_BASIS = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+
+
+def seeded_hash(seed: int) -> Callable[[object], int]:
+    """
+    Creates a hash function that mixes the built-in hash of a key with a seed.
+    The mixing is the finalizer of the SplitMix64 generator, in which every input bit affects every output bit,
+    so keys that differ in a few bits, such as strided integers, get unrelated hashes. Tables using different
+    seeds place the same keys differently, so a key set crafted to collide in one table does not collide in another.
+    :param seed: is the seed.
+    :return: the hash function, taking a hashable key and returning a 64-bit integer.
+    """
+    seed &= _MASK
+
+    def mix(key: object) -> int:
+        value = ((hash(key) ^ seed) + 0x9E3779B97F4A7C15) & _MASK
+        value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+        value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+        return value ^ (value >> 31)
+
+    return mix
+
+
+def fnv1a_hash(key: str) -> int:
+    """
+    Hashes a string with the 64-bit FNV-1a function, over its UTF-8 bytes.
+    Unlike the built-in hash of a string, which changes between processes, this gives the same hash every time,
+    so a table built from the same keys has the same layout in every run.
+    :param key: is the string.
+    :return: the 64-bit hash.
+    """
+    value = _FNV_OFFSET_BASIS
+    for byte in key.encode('utf-8'):
+        value = ((value ^ byte) * _FNV_PRIME) & _MASK
+    return value
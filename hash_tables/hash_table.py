@@ -1,8 +1,15 @@
-from typing import List
+from typing import Callable, Iterable, List
+
+from hash_tables.collision_report import CollisionReport
+
+# Multiplying a hash by 2^64 divided by the golden ratio mixes its low bits into its high bits,
+# which are then scaled down to a bucket index
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK = (1 << 64) - 1
 
 
 class _Node:
-    __key: int
+    __key: object
     __value: str
     _next = None  # Reference to next Node
 
@@ -21,6 +28,10 @@ class _Node:
     def value(self):
         return self.__value
 
+    @value.setter
+    def value(self, value):
+        self.__value = value
+
     @property
     def next(self):
         return self._next
@@ -35,7 +46,7 @@ class _LinkedList:
     def size(self):
         return self.__size
 
-    def add_last(self, key: int, value: str) -> None:
+    def add_last(self, key: object, value: str) -> None:
         """
         Adds a node at the end of the linked list.
 
@@ -43,7 +54,16 @@ class _LinkedList:
         :param value: is the value.
         """
 
-        node = _Node(key, value)
+        self.add_node(_Node(key, value))
+
+    def add_node(self, node: _Node) -> None:
+        """
+        Adds an existing node at the end of the linked list, such as a node moved from another list.
+
+        :param node: is the node, which must not be in another list.
+        """
+
+        node._next = None
 
         # List has no items
         if self.__is_empty():
@@ -52,9 +72,61 @@ class _LinkedList:
         # List has last item
         else:
             self.__last._next = node
+            self.__last = node
 
         self.__size += 1
 
+    def put(self, key: object, value: str) -> bool:
+        """
+        Updates the value of the node with a given key, or adds a node at the end of the linked list
+        if there is none, in a single pass over the list.
+
+        :param key: is the key.
+        :param value: is the value.
+        :return: a boolean value determining if a new node was added.
+        """
+        current_node = self.__first
+
+        while current_node:
+            if current_node.key == key:
+                current_node.value = value
+                return False
+            current_node = current_node.next
+
+        # The whole list was walked without finding the key, so it is added at the end
+        self.add_last(key, value)
+        return True
+
+    def unlink(self, key: object) -> _Node or None:
+        """
+        Unlinks the node with a given key from the linked list, in a single pass over the list.
+        The previous node is tracked along the way, so it does not have to be searched for afterwards.
+
+        :param key: is the key.
+        :return: the unlinked node, or None if the linked list does not contain the key.
+        """
+        previous: _Node or None = None
+        current_node = self.__first
+
+        while current_node:
+            if current_node.key == key:
+                if previous is None:
+                    self.__first = current_node.next
+                else:
+                    previous._next = current_node.next
+
+                if current_node is self.__last:
+                    self.__last = previous
+
+                current_node._next = None
+                self.__size -= 1
+                return current_node
+
+            previous = current_node
+            current_node = current_node.next
+
+        return None
+
     def __is_empty(self) -> bool:
         """
         Checks if a linked list is empty.
@@ -64,7 +136,7 @@ class _LinkedList:
 
         return self.__first is None
 
-    def contains(self, key: int) -> bool:
+    def contains(self, key: object) -> bool:
         """
         Checks if the linked list contains a node with a given key.
 
@@ -72,9 +144,9 @@ class _LinkedList:
         :return: a boolean representation of whether the linked list contains the given value or not.
         """
 
-        return self.index_of(key) != -1
+        return self.get_node(key) is not None
 
-    def index_of(self, key: int) -> int:
+    def index_of(self, key: object) -> int:
         """
         Gets the index of a given key from the linked list.
         Time complexity: O(n).
@@ -95,7 +167,7 @@ class _LinkedList:
 
         return -1
 
-    def get_node(self, key: int) -> _Node or None:
+    def get_node(self, key: object) -> _Node or None:
         """
         Gets a node with a given key. A key is a unique identifier.
         Time complexity: O(n).
@@ -112,7 +184,7 @@ class _LinkedList:
 
         return None
 
-    def remove(self, key: int):
+    def remove(self, key: object):
         """
         Removes the node with the given key from the linked list.
 
@@ -122,38 +194,7 @@ class _LinkedList:
             raise AttributeError(
                 "Linked list is empty and has no last element.")
 
-        # List has only one element
-        if self.__first == self.__last:
-            self.__first = None
-            self.__last = None
-            self.__size = 0
-            return
-
-        index = self.index_of(key)
-
-        # Key-value pair does not exist in linked list
-        if index == -1:
-            return None
-
-        nth_from_the_end = self.get_nth_node_from_end(self.__size - index)
-
-        previous: _Node or None = self.__get_previous_node(nth_from_the_end)
-
-        # Unlink what was previously the nth node from the end
-        nth_from_the_end = previous
-        nth_from_the_end._next = None
-        self.__size -= 1
-
-    def __get_previous_node(self, node: _Node) -> _Node or None:
-        current_node = self.__first
-
-        while current_node.next is not None:
-            # Currently at second last node in list
-            if current_node.next == node:
-                return current_node
-            current_node = current_node.next
-
-        return None
+        self.unlink(key)
 
     def get_nth_node_from_end(self, n: int) -> _Node:
         """
@@ -186,6 +227,13 @@ class _LinkedList:
             first_pointer = first_pointer.next
             second_pointer = second_pointer.next
 
+    def __iter__(self):
+        current_node = self.__first
+
+        while current_node:
+            yield current_node
+            current_node = current_node.next
+
     def print(self):
         current_node = self.__first
 
@@ -198,9 +246,21 @@ class _LinkedList:
 class HashTable:
     __table: List[_LinkedList or None]
 
-    def __init__(self, size):
+    # The table being migrated into while rehashing, or None
+    __new_table: List[_LinkedList or None] or None
+
+    # The buckets of the old table below this index have been migrated
+    __rehash_index: int
+
+    __size: int
+    __hash_function: Callable[[object], int]
+    __max_load_factor: float
+    __rehash_step: int or None
+
+    def __init__(self, size, hash_function: Callable[[object], int] = hash, max_load_factor: float = 1.0,
+                 rehash_step: int or None = 1):
         """
-        An implementation of a hash table, with integer keys and string values.
+        An implementation of a hash table, with any hashable keys and string values.
         We use chaining for handling collisions.
         This means that instead of storing the key-value pairs inside each slot in the internal array,
         we store them in linked lists.
@@ -208,77 +268,359 @@ class HashTable:
         This means that the internal array consists of _LinkedList instances,
         where each node is of type _Node.
 
-        :param size: is the size of the internal array.
-        :raise AttributeError: if the size is less than or equal to 0.
+        Once there are more key-value pairs than max_load_factor per bucket, the internal array doubles in size.
+        By default, the key-value pairs are then moved over incrementally: the old and the new array are kept
+        side by side, and each put, get and remove moves the next rehash_step buckets, so no single call ever
+        pays for moving every key-value pair. Until every bucket is moved, a key is looked up in the new array
+        if its bucket in the old array has been moved already, and in the old array otherwise.
+
+        :param size: is the initial size of the internal array.
+        :param hash_function: takes a key and returns an integer, which must be equal for equal keys.
+        Defaults to the built-in hash. See hash_functions for a seeded and a string-specific alternative.
+        :param max_load_factor: is the highest mean amount of key-value pairs per bucket before the array grows.
+        :param rehash_step: is the amount of non-empty buckets moved per call while rehashing,
+        or None to move every bucket at once as soon as the array grows.
+        :raise AttributeError: if the size, the maximum load factor or the rehash step is less than or equal to 0.
         """
 
         if size <= 0:
             raise AttributeError("Size must be greater than zero.")
 
-        self.__table = [_LinkedList() for i in range(size)]
+        if max_load_factor <= 0:
+            raise AttributeError("Maximum load factor must be greater than zero.")
+
+        if rehash_step is not None and rehash_step <= 0:
+            raise AttributeError("Rehash step must be greater than zero.")
 
-    def put(self, key: int, value: str):
+        # Buckets are created on their first put, so a new array of any size is allocated in one step
+        self.__table = [None] * size
+        self.__new_table = None
+        self.__rehash_index = 0
+        self.__size = 0
+        self.__hash_function = hash_function
+        self.__max_load_factor = max_load_factor
+        self.__rehash_step = rehash_step
+
+    @property
+    def size(self) -> int:
         """
-        Puts a key-value pair into the hash table.
+        Gets the amount of key-value pairs in the hash table.
+        """
+        return self.__size
+
+    @property
+    def is_rehashing(self) -> bool:
+        """
+        Gets a boolean value determining if key-value pairs are being moved to a larger internal array.
+        """
+        return self.__new_table is not None
+
+    def put(self, key: object, value: str):
+        """
+        Puts a key-value pair into the hash table, replacing the value if the key already exists.
+        The bucket is walked once, both to look for the key and to reach its end.
 
         :param key: is the key.
         :param value: is the value.
         """
-        index = self.__hash(key)
+        if self.__new_table is not None:
+            self.__rehash(self.__rehash_step)
 
-        linked_list = self.__table[index]
+        linked_list = self.__get_bucket(key, create=True)
 
-        linked_list.add_last(key, value)
+        if linked_list.put(key, value):
+            self.__size += 1
 
-    def get(self, key: int) -> str or None:
+            if self.__new_table is None and self.__size > len(self.__table) * self.__max_load_factor:
+                self.__grow(len(self.__table) * 2)
+
+    def get(self, key: object) -> str or None:
         """
-        Gets a key-value pair from the hash table.
+        Gets the value of a key from the hash table, in a single pass over its bucket.
 
         :param key: is the key of the key-value pair.
         :return: the value of the key-value pair, or None if the linked list does not contain the key-value pair.
         """
-        index = self.__hash(key)
+        if self.__new_table is not None:
+            self.__rehash(self.__rehash_step)
 
-        linked_list = self.__table[index]
+        linked_list = self.__get_bucket(key)
+        if linked_list is None:
+            return None
 
-        if linked_list.contains_iterative(key):
-            return linked_list.get_node(key)
+        node = linked_list.get_node(key)
 
-        return None
+        return node.value if node is not None else None
 
-    def remove(self, key: int):
+    def remove(self, key: object):
         """
-        Removes a Node entry from the hash table.
+        Removes a Node entry from the hash table, in a single pass over its bucket.
+        Nothing happens if the key does not exist.
 
         :param key: is the key in the key-value pair.
         """
-        index = self.__hash(key)
+        if self.__new_table is not None:
+            self.__rehash(self.__rehash_step)
 
-        linked_list = self.__table[index]
+        linked_list = self.__get_bucket(key)
 
+        # The bucket has never held a key
         if linked_list is None:
-            raise AttributeError("The linked list is undefined.")
+            return
 
-        if linked_list.contains_iterative(key):
-            linked_list.remove(key)
+        if linked_list.unlink(key) is not None:
+            self.__size -= 1
 
-    def __hash(self, key: int) -> int:
+    def put_many(self, items: Iterable, values: Iterable[str] or None = None):
+        """
+        Puts many key-value pairs into the hash table, replacing the values of keys that already exist.
+        The internal array is grown at most once, straight to a size that fits the whole batch, and the buckets of all
+        keys are found in one pass, so the cost of each call to put is paid once per batch rather than once per key.
+        The key-value pairs are still moved to a grown array incrementally, by as many buckets as the same amount of
+        calls to put would move. Only if the batch needs the array to grow while it is already being rehashed,
+        is the rest of that rehash finished first.
+        As every key is counted as new when sizing the array, a batch of mostly existing keys may grow it early.
+
+        :param items: are the key-value pairs, or only the keys if the values are given separately.
+        :param values: are the values, in the same order as the keys, or None if items holds key-value pairs.
+        :raise AttributeError: if the keys and the values are not of the same length.
         """
-        A very simple hash function for calculating the index of the relevant key-value pair.
+        if values is None:
+            keys, values = [], []
+            for key, value in items:
+                keys.append(key)
+                values.append(value)
+        else:
+            keys, values = list(items), list(values)
+
+            if len(keys) != len(values):
+                raise AttributeError("There must be as many values as keys.")
+
+        # Every key may be new, so the array must fit the current key-value pairs and the whole batch.
+        # While rehashing, that is the new array the key-value pairs are moving to.
+        required_size = self.__size + len(keys)
+        target_table = self.__new_table if self.__new_table is not None else self.__table
+
+        if required_size > len(target_table) * self.__max_load_factor:
+            size = len(target_table)
+            while required_size > size * self.__max_load_factor:
+                size *= 2
+
+            # Only two arrays are kept, so a running rehash has to finish before the next one can start
+            if self.__new_table is not None:
+                self.__rehash(len(self.__table))
+
+            self.__grow(size)
+
+        # The batch moves as many buckets as the same amount of calls to put would
+        if self.__new_table is not None:
+            self.__rehash(self.__rehash_step * len(keys))
+
+        for linked_list, key, value in zip(self.__get_buckets(keys, create=True), keys, values):
+            if linked_list.put(key, value):
+                self.__size += 1
+
+    def get_many(self, keys: Iterable) -> List[str or None]:
+        """
+        Gets the values of many keys from the hash table, finding the buckets of all keys in one pass.
+
+        :param keys: are the keys.
+        :return: the values of the keys, in the same order, with None for each key the hash table does not contain.
+        """
+        keys = list(keys)
+
+        if self.__new_table is not None:
+            self.__rehash(self.__rehash_step * len(keys))
+
+        result: List[str or None] = []
+
+        for linked_list, key in zip(self.__get_buckets(keys), keys):
+            node = linked_list.get_node(key) if linked_list is not None else None
+            result.append(node.value if node is not None else None)
+
+        return result
+
+    def remove_many(self, keys: Iterable):
+        """
+        Removes many Node entries from the hash table, finding the buckets of all keys in one pass.
+        Nothing happens for keys that do not exist.
+
+        :param keys: are the keys.
+        """
+        keys = list(keys)
+
+        if self.__new_table is not None:
+            self.__rehash(self.__rehash_step * len(keys))
+
+        for linked_list, key in zip(self.__get_buckets(keys), keys):
+            if linked_list is not None and linked_list.unlink(key) is not None:
+                self.__size -= 1
+
+    def get_collision_report(self) -> CollisionReport:
+        """
+        Reports how evenly the keys are spread over the buckets: the chain lengths, and how many keys
+        a lookup of each key steps through. The key at position i of a chain takes i + 1 steps,
+        so this only reads the size of each bucket. While rehashing, the buckets of both arrays are included.
+
+        :return: the report.
+        """
+        tables = [self.__table] if self.__new_table is None else [self.__table, self.__new_table]
+
+        chain_lengths = [linked_list.size for table in tables for linked_list in table
+                         if linked_list is not None and linked_list.size > 0]
+
+        # Buckets already moved to the new array are not counted as part of the old one
+        bucket_count = sum(len(table) for table in tables) - self.__rehash_index
+
+        # Every chain of length n holds one key at each probe length from 1 to n
+        probe_histogram = [0] * max(chain_lengths, default=0)
+        for length in chain_lengths:
+            for position in range(length):
+                probe_histogram[position] += 1
+
+        return CollisionReport(bucket_count, chain_lengths, probe_histogram)
+
+    def __get_bucket(self, key: object, create: bool = False) -> _LinkedList or None:
+        """
+        Gets the bucket a key belongs in. While rehashing, this is in the new array if the bucket of the key
+        in the old array has been moved already, so only one bucket is ever searched for a key.
+
+        :param key: is the key.
+        :param create: is a boolean value determining if a bucket that has never held a key is created.
+        :return: the linked list of the bucket, or None if it has never held a key and is not created.
+        """
+        mixed_hash = self.__hash(key)
+        table = self.__table
+        index = (mixed_hash * len(table)) >> 64
+
+        if index < self.__rehash_index:
+            table = self.__new_table
+            index = (mixed_hash * len(table)) >> 64
+
+        linked_list = table[index]
+
+        if linked_list is None and create:
+            linked_list = _LinkedList()
+            table[index] = linked_list
+
+        return linked_list
+
+    def __get_buckets(self, keys: List[object], create: bool = False) -> List[_LinkedList or None]:
+        """
+        Gets the buckets many keys belong in, in one pass, the same way as __get_bucket does for a single key.
+        The buckets are looked up before any key is put or removed, so no rehashing may happen in between.
+
+        :param keys: are the keys.
+        :param create: is a boolean value determining if buckets that have never held a key are created.
+        :return: the linked lists of the buckets, in the same order as the keys,
+        with None for each bucket that has never held a key and is not created.
+        """
+        table = self.__table
+        new_table = self.__new_table
+        rehash_index = self.__rehash_index
+        hash_function = self.__hash_function
+        buckets: List[_LinkedList or None] = []
+
+        for key in keys:
+            mixed_hash = (hash_function(key) * _MULTIPLIER) & _MASK
+            current_table = table
+            index = (mixed_hash * len(table)) >> 64
+
+            if index < rehash_index:
+                current_table = new_table
+                index = (mixed_hash * len(new_table)) >> 64
+
+            linked_list = current_table[index]
+
+            if linked_list is None and create:
+                linked_list = _LinkedList()
+                current_table[index] = linked_list
+
+            buckets.append(linked_list)
+
+        return buckets
+
+    def __grow(self, size: int):
+        """
+        Starts moving the key-value pairs to a new, larger internal array.
+
+        :param size: is the size of the new array.
+        """
+        self.__new_table = [None] * size
+        self.__rehash_index = 0
+
+        if self.__rehash_step is None:
+            self.__rehash(len(self.__table))
+
+    def __rehash(self, bucket_count: int):
+        """
+        Moves the next buckets of the old internal array to the new one, the way Redis rehashes its dictionaries.
+        Runs of empty buckets are skipped over too, but at most ten per bucket to move,
+        so a sparse array does not make a single call expensive either.
+        Once every bucket has been moved, the new array replaces the old one.
+
+        :param bucket_count: is the amount of non-empty buckets to move.
+        """
+        table = self.__table
+        new_table = self.__new_table
+        empty_visits = bucket_count * 10
+
+        while bucket_count > 0 and self.__rehash_index < len(table):
+            linked_list = table[self.__rehash_index]
+
+            if linked_list is not None and linked_list.size > 0:
+                # The nodes themselves are relinked into the new buckets, rather than copied
+                for node in list(linked_list):
+                    index = (self.__hash(node.key) * len(new_table)) >> 64
+
+                    if new_table[index] is None:
+                        new_table[index] = _LinkedList()
+
+                    new_table[index].add_node(node)
+
+                bucket_count -= 1
+            else:
+                empty_visits -= 1
+
+            # The moved bucket is never looked at again
+            table[self.__rehash_index] = None
+            self.__rehash_index += 1
+
+            if empty_visits == 0:
+                break
+
+        if self.__rehash_index == len(table):
+            self.__table = new_table
+            self.__new_table = None
+            self.__rehash_index = 0
+
+    def __hash(self, key: object) -> int:
+        """
+        Calculates the mixed hash of a key, from which the index of its bucket is taken.
+        The hash of the key is mixed, and the high bits of the result are scaled down to the amount of buckets,
+        so keys that only differ by a stride, such as multiples of the amount of buckets, still spread evenly.
         Chaining is later used to handling collisions.
 
         :param key: is the key of the key-value pair to be put into the hash table.
-        :return: the index of the relevant key-value pair in the hash table.
+        :return: the mixed 64-bit hash. Multiplying it by the amount of buckets and shifting it right by 64 bits
+        gives the index of the relevant key-value pair in the hash table.
         """
 
-        return key % len(self.__table)
+        return (self.__hash_function(key) * _MULTIPLIER) & _MASK
 
     def print(self):
-        for i in range(len(self.__table)):
-            print(f"Linked list at index: {i}")
+        tables = [self.__table] if self.__new_table is None else [self.__table, self.__new_table]
+
+        for table in tables:
+            for i in range(len(table)):
+                # Buckets moved to the new array while rehashing are left out
+                if table[i] is None:
+                    continue
+
+                print(f"Linked list at index: {i}")
 
-            self.__table[i].print()
-            print()
+                table[i].print()
+                print()
 
 
 if __name__ == '__main__':
@@ -293,11 +635,27 @@ if __name__ == '__main__':
 
     hash_table.print()
 
-    print(f'Node value with key 9: {hash_table.get(9).value}')
-    print(f'Node value with key 2: {hash_table.get(2).value}')
-    print(f'Node value with key 56483721657860: {hash_table.get(56483721657860).value}')
+    print(f'Node value with key 9: {hash_table.get(9)}')
+    print(f'Node value with key 2: {hash_table.get(2)}')
+    print(f'Node value with key 56483721657860: {hash_table.get(56483721657860)}')
     print(f'Node value with key that does not exist: {hash_table.get(14563236251)}')
 
     hash_table.remove(5)
 
     print(f'Node value from key (5) that was just removed: {hash_table.get(5)}')
+
+    hash_table.put("Key", "Any hashable key works")
+    hash_table.put((1, 2), "Even a tuple")
+
+    print(f'Node value with key "Key": {hash_table.get("Key")}')
+    print(f'Node value with key (1, 2): {hash_table.get((1, 2))}')
+    print(hash_table.get_collision_report())
+
+    hash_table.put_many([(10, "Sit"), (11, "Amet")])
+    hash_table.put_many([12, 13], ["Consectetur", "Adipiscing"])
+
+    print(f'Node values with keys 10 to 14: {hash_table.get_many(range(10, 15))}')
+
+    hash_table.remove_many([10, 11, 12, 13])
+
+    print(f'Node values with keys (10 to 14) that were just removed: {hash_table.get_many(range(10, 15))}')
@@ -0,0 +1,301 @@
+from typing import Callable, List
+
+from hash_tables.collision_report import CollisionReport
+
+# Marks a slot that holds no key. A unique object, so that any key, including None, can be stored.
+_EMPTY = object()
+
+# Fibonacci hashing: multiplying by 2^64 divided by the golden ratio, and keeping the top bits,
+# spreads keys that only differ by a stride, such as multiples of the capacity, over the whole table.
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK = (1 << 64) - 1
+
+
+class OpenAddressingHashTable:
+    """
+    An implementation of a hash table using open addressing, with any hashable keys and string values.
+    Instead of chaining collisions in linked lists, every key-value pair is stored directly in one of two
+    flat, parallel arrays of slots. A key belongs in the slot given by its hash, or, if that slot is taken,
+    in the next free slot after it, which is called linear probing.
+
+    Removing a key shifts the following keys of the same probe sequence back by one slot,
+    instead of leaving a tombstone, so lookups never have to skip over deleted slots.
+
+    The table doubles its capacity when the load factor would go above max_load_factor,
+    and halves it when the load factor drops below a quarter of that, so lookups stay O(1) on average.
+    """
+    __slots__ = ('__keys', '__values', '__size', '__shift', '__max_load_factor', '__minimum_capacity',
+                 '__hash_function')
+
+    __keys: List[object]
+    __values: List[str or None]
+    __size: int
+
+    # Shifting the 64-bit product right by this amount gives an index below the capacity
+    __shift: int
+
+    __max_load_factor: float
+    __minimum_capacity: int
+    __hash_function: Callable[[object], int]
+
+    def __init__(self, capacity: int = 8, max_load_factor: float = 0.7,
+                 hash_function: Callable[[object], int] = hash):
+        """
+        Creates an empty hash table.
+        :param capacity: is the initial amount of slots. It is rounded up to a power of two,
+        and the table never shrinks below it.
+        :param max_load_factor: is the highest fraction of slots that may be in use before the table grows.
+        :param hash_function: takes a key and returns an integer, which must be equal for equal keys.
+        Defaults to the built-in hash. See hash_functions for a seeded and a string-specific alternative.
+        :raise AttributeError: if the capacity is less than or equal to 0,
+        or the maximum load factor is not between 0 and 1.
+        """
+        if capacity <= 0:
+            raise AttributeError("Capacity must be greater than zero.")
+
+        if not 0 < max_load_factor < 1:
+            raise AttributeError("Maximum load factor must be between 0 and 1.")
+
+        self.__max_load_factor = max_load_factor
+        self.__hash_function = hash_function
+        self.__minimum_capacity = 1 << max(capacity - 1, 1).bit_length()
+        self.__allocate(self.__minimum_capacity)
+
+    @property
+    def size(self) -> int:
+        """
+        Gets the amount of key-value pairs in the hash table.
+        """
+        return self.__size
+
+    @property
+    def capacity(self) -> int:
+        """
+        Gets the amount of slots in the hash table.
+        """
+        return len(self.__keys)
+
+    @property
+    def load_factor(self) -> float:
+        """
+        Gets the fraction of slots in use.
+        """
+        return self.__size / len(self.__keys)
+
+    def put(self, key: object, value: str):
+        """
+        Puts a key-value pair into the hash table, replacing the value if the key already exists.
+        :param key: is the key.
+        :param value: is the value.
+        """
+        if (self.__size + 1) > len(self.__keys) * self.__max_load_factor:
+            self.__resize(len(self.__keys) * 2)
+
+        keys = self.__keys
+        mask = len(keys) - 1
+        index = self.__index(key)
+
+        while True:
+            current = keys[index]
+
+            if current is _EMPTY:
+                keys[index] = key
+                self.__values[index] = value
+                self.__size += 1
+                return
+
+            if current == key:
+                self.__values[index] = value
+                return
+
+            index = (index + 1) & mask
+
+    def get(self, key: object) -> str or None:
+        """
+        Gets the value of a key.
+        :param key: is the key.
+        :return: the value of the key, or None if the hash table does not contain the key.
+        """
+        index = self.__find(key)
+        return self.__values[index] if index != -1 else None
+
+    def contains(self, key: object) -> bool:
+        """
+        Checks if the hash table contains a key.
+        :param key: is the key.
+        :return: a boolean value determining if the hash table contains the key.
+        """
+        return self.__find(key) != -1
+
+    def remove(self, key: object):
+        """
+        Removes a key-value pair from the hash table. Nothing happens if the key does not exist.
+        :param key: is the key.
+        """
+        index = self.__find(key)
+        if index == -1:
+            return
+
+        keys = self.__keys
+        values = self.__values
+        mask = len(keys) - 1
+
+        # Backward-shift deletion: walk the rest of the probe sequence, and move each key that is allowed
+        # to live in the free slot into it. A key may only move back to a slot between its home and itself,
+        # or it could no longer be found.
+        free = index
+        current = (index + 1) & mask
+        shift = self.__shift
+        hash_function = self.__hash_function
+
+        while keys[current] is not _EMPTY:
+            home = ((hash_function(keys[current]) * _MULTIPLIER) & _MASK) >> shift
+
+            # The distance from a slot to the current slot, going forwards and wrapping around
+            if (current - home) & mask >= (current - free) & mask:
+                keys[free] = keys[current]
+                values[free] = values[current]
+                free = current
+
+            current = (current + 1) & mask
+
+        keys[free] = _EMPTY
+        values[free] = None
+        self.__size -= 1
+
+        if len(keys) > self.__minimum_capacity and self.__size < len(keys) * self.__max_load_factor / 4:
+            self.__resize(len(keys) // 2)
+
+    def get_collision_report(self) -> CollisionReport:
+        """
+        Reports how evenly the keys are spread over the slots. A chain is a run of occupied slots,
+        and the probe length of a key is its distance from its home slot, plus one.
+        :return: the report.
+        """
+        keys = self.__keys
+        mask = len(keys) - 1
+
+        chain_lengths: List[int] = []
+        probe_histogram: List[int] = []
+
+        if self.__size == 0:
+            return CollisionReport(len(keys), chain_lengths, probe_histogram)
+
+        # Start right after a free slot, so no run of occupied slots is split by wrapping around.
+        # There is always a free slot, as the load factor stays below 1.
+        start = keys.index(_EMPTY) + 1
+        length = 0
+
+        for offset in range(len(keys)):
+            index = (start + offset) & mask
+
+            if keys[index] is _EMPTY:
+                if length > 0:
+                    chain_lengths.append(length)
+                length = 0
+                continue
+
+            length += 1
+
+            probe_length = ((index - self.__index(keys[index])) & mask) + 1
+            while len(probe_histogram) < probe_length:
+                probe_histogram.append(0)
+            probe_histogram[probe_length - 1] += 1
+
+        if length > 0:
+            chain_lengths.append(length)
+
+        return CollisionReport(len(keys), chain_lengths, probe_histogram)
+
+    def __find(self, key: object) -> int:
+        """
+        Finds the slot of a key.
+        :param key: is the key.
+        :return: the index of the slot holding the key, or -1 if the hash table does not contain the key.
+        """
+        keys = self.__keys
+        mask = len(keys) - 1
+        index = self.__index(key)
+
+        while True:
+            current = keys[index]
+
+            # Keys are never stored past a free slot in their probe sequence
+            if current is _EMPTY:
+                return -1
+
+            if current == key:
+                return index
+
+            index = (index + 1) & mask
+
+    def __index(self, key: object) -> int:
+        """
+        Calculates the home slot of a key, where its probe sequence starts.
+        :param key: is the key.
+        :return: the index of the slot.
+        """
+        return ((self.__hash_function(key) * _MULTIPLIER) & _MASK) >> self.__shift
+
+    def __allocate(self, capacity: int):
+        self.__keys = [_EMPTY] * capacity
+        self.__values = [None] * capacity
+        self.__size = 0
+        self.__shift = 64 - (capacity.bit_length() - 1)
+
+    def __resize(self, capacity: int):
+        """
+        Moves every key-value pair into a new array of slots.
+        :param capacity: is the new amount of slots, a power of two.
+        """
+        keys = self.__keys
+        values = self.__values
+
+        self.__allocate(capacity)
+
+        new_keys = self.__keys
+        new_values = self.__values
+        mask = capacity - 1
+        shift = self.__shift
+        hash_function = self.__hash_function
+
+        # Every key is unique, so each one goes in the first free slot of its probe sequence
+        for key, value in zip(keys, values):
+            if key is _EMPTY:
+                continue
+
+            index = ((hash_function(key) * _MULTIPLIER) & _MASK) >> shift
+            while new_keys[index] is not _EMPTY:
+                index = (index + 1) & mask
+
+            new_keys[index] = key
+            new_values[index] = value
+            self.__size += 1
+
+    def print(self):
+        for index in range(len(self.__keys)):
+            if self.__keys[index] is not _EMPTY:
+                print(f"Slot {index}: [key={self.__keys[index]}, value={self.__values[index]}]")
+
+
+if __name__ == '__main__':
+    hash_table = OpenAddressingHashTable()
+
+    hash_table.put(2, "Hello")
+    hash_table.put(4, "World")
+    hash_table.put(9, "Dolor")
+    hash_table.put(5, "Lorem")
+    hash_table.put(5, "Ipsum")
+    hash_table.put(56483721657860, "Abnormally large number")
+
+    hash_table.print()
+
+    print(f'Value with key 9: {hash_table.get(9)}')
+    print(f'Value with key 5: {hash_table.get(5)}')
+    print(f'Value with key that does not exist: {hash_table.get(14563236251)}')
+
+    hash_table.remove(5)
+
+    print(f'Value with key (5) that was just removed: {hash_table.get(5)}')
+    print(f'Size: {hash_table.size}, capacity: {hash_table.capacity}')
+    print(hash_table.get_collision_report())
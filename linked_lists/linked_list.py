@@ -2,11 +2,13 @@ from typing import List
 
 
 class _Node:
+    __slots__ = ('__value', '_next')
     __value: int
-    _next = None  # Reference to next Node
+    _next: '_Node' or None  # Reference to next Node
 
     def __init__(self, value):
         self.__value = value
+        self._next = None
 
     @property
     def next(self):
@@ -18,9 +20,15 @@ class _Node:
 
 
 class LinkedList:
-    __first: _Node or None = None  # Reference to head Node
-    __last: _Node or None = None  # Reference to tail Node
-    __size: int = 0
+    __slots__ = ('__first', '__last', '__size')
+    __first: _Node or None  # Reference to head Node
+    __last: _Node or None  # Reference to tail Node
+    __size: int
+
+    def __init__(self):
+        self.__first = None
+        self.__last = None
+        self.__size = 0
 
     def add_first(self, item: int) -> None:
         """
@@ -2,7 +2,11 @@ from linked_lists.linked_list import LinkedList
 
 
 class LinkedListQueue:
-    __linked_list: LinkedList = LinkedList()
+    __slots__ = ('__linked_list',)
+    __linked_list: LinkedList
+
+    def __init__(self):
+        self.__linked_list = LinkedList()
 
     def enqueue(self, item: int):
         self.__linked_list.add_last(item)
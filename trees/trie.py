@@ -4,15 +4,19 @@ ALPHABET_SIZE = 26
 
 
 class _Node:
+    __slots__ = ('_value', '_children', '_is_end_of_word')
+
     # Optimally, this should be a character, but Python does not support char data type
     _value: str
 
     # Holds key-value pairs with key: str, value: _Node
-    _children = {}
-    _is_end_of_word: bool = False
+    _children: Dict[str, '_Node']
+    _is_end_of_word: bool
 
     def __init__(self, value: str):
         self._value = value
+        self._children = {}
+        self._is_end_of_word = False
 
     @property
     def children(self):
@@ -53,7 +57,11 @@ class _Node:
 
 
 class Trie:
-    __root: _Node = _Node(" ")
+    __slots__ = ('__root',)
+    __root: _Node
+
+    def __init__(self):
+        self.__root = _Node(" ")
 
     def insert(self, word: str):
         """